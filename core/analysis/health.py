@@ -0,0 +1,48 @@
+"""Data health check module for detecting annotation errors."""
+
+from PySide6.QtCore import QThread, Signal
+
+from core.analysis.statistics import StatisticsAnalyzer
+
+
+class HealthCheckThread(QThread):
+    """Thread for running the annotation health check off the GUI thread."""
+
+    batch_found = Signal(object)  # list of HealthError
+    finished_analysis = Signal(int)  # total number of errors
+    error_occurred = Signal(str)
+
+    BATCH_SIZE = 200
+
+    def __init__(self, df, images_dict):
+        """Initialize health check thread.
+
+        Args:
+            df: DataFrame with annotations.
+            images_dict: Dictionary mapping image_id to image metadata.
+        """
+        super().__init__()
+        self.df = df
+        self.images_dict = images_dict
+
+    def run(self):
+        """Execute the health check, emitting errors in batches as found."""
+        try:
+            total = 0
+            batch = []
+            for error in StatisticsAnalyzer.check_health(self.df, self.images_dict):
+                if self.isInterruptionRequested():
+                    return
+
+                batch.append(error)
+                if len(batch) >= self.BATCH_SIZE:
+                    self.batch_found.emit(batch)
+                    total += len(batch)
+                    batch = []
+
+            if batch:
+                self.batch_found.emit(batch)
+                total += len(batch)
+            self.finished_analysis.emit(total)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
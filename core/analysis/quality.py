@@ -1,12 +1,24 @@
 """Image quality analysis module for brightness, contrast, and blur detection."""
 
 import os
+import shelve
+import time
 
 import cv2
 import numpy as np
 import pandas as pd
 from PySide6.QtCore import QThread, Signal
 
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "odeda")
+# Per-image metrics keyed by file path; reused while (mtime, size) match.
+# shelve unpickles its entries, which is acceptable only because the file
+# lives in the user's own cache directory and is written solely by this app
+IMAGE_CACHE_PATH = os.path.join(CACHE_DIR, "quality_img.db")
+IMAGE_CACHE_TTL = 30 * 24 * 60 * 60  # seconds
+# Expired entries are pruned at most this often (scanning the file is slow)
+IMAGE_CACHE_PRUNE_INTERVAL = 24 * 60 * 60  # seconds
+_PRUNED_AT_KEY = "\0pruned_at"  # not a valid path, so never an image key
+
 
 class QualityAnalyzerThread(QThread):
     """Thread for analyzing image quality metrics (brightness, contrast, blur)."""
@@ -15,26 +27,116 @@ class QualityAnalyzerThread(QThread):
     finished_analysis = Signal(object)
     error_occurred = Signal(str)
 
-    def __init__(self, image_dict, root_path):
+    def __init__(self, image_dict, root_path, image_cache_path=None):
         """Initialize quality analysis thread.
 
         Args:
             image_dict: Dictionary mapping image_id to image metadata.
             root_path: Root directory path for image files.
+            image_cache_path: shelve file of per-image metrics, so unchanged
+                images are not decoded again (optional).
         """
         super().__init__()
         self.image_dict = image_dict
         self.root_path = root_path
+        self.image_cache_path = image_cache_path
+
+    def _open_image_cache(self):
+        if not self.image_cache_path:
+            return None
+        try:
+            os.makedirs(os.path.dirname(self.image_cache_path), exist_ok=True)
+            image_cache = shelve.open(self.image_cache_path)
+        except Exception as e:
+            print(f"Error opening quality image cache: {e}")
+            return None
+        try:
+            self._prune_image_cache(image_cache)
+        except Exception as e:
+            print(f"Error pruning quality image cache: {e}")
+        return image_cache
+
+    @staticmethod
+    def _prune_image_cache(image_cache):
+        """Delete entries older than IMAGE_CACHE_TTL, at most once a day."""
+        now = time.time()
+        if now - image_cache.get(_PRUNED_AT_KEY, 0) < IMAGE_CACHE_PRUNE_INTERVAL:
+            return
+        cutoff = now - IMAGE_CACHE_TTL
+        expired = [
+            key
+            for key in image_cache.keys()
+            if key != _PRUNED_AT_KEY and image_cache[key]["stored_at"] < cutoff
+        ]
+        for key in expired:
+            del image_cache[key]
+        image_cache[_PRUNED_AT_KEY] = now
+
+    def _measure(self, full_path, image_cache):
+        """Return (brightness, contrast, blur_score) for an image, or None.
+
+        Raises OSError if the file cannot be stat'ed.
+        """
+        stat = os.stat(full_path)
+        key = os.path.abspath(full_path)
+        if image_cache is not None:
+            entry = image_cache.get(key)
+            if (
+                entry is not None
+                and entry["mtime_ns"] == stat.st_mtime_ns
+                and entry["size"] == stat.st_size
+                and time.time() - entry["stored_at"] < IMAGE_CACHE_TTL
+            ):
+                return entry["metrics"]
+
+        img = cv2.imread(full_path, cv2.IMREAD_GRAYSCALE)
+        if img is None:
+            return None
+        # meanStdDev gets mean and std in one native pass over the pixels
+        mean, std = cv2.meanStdDev(img)
+        _, lap_std = cv2.meanStdDev(cv2.Laplacian(img, cv2.CV_64F))
+        metrics = (
+            float(mean[0, 0]),
+            float(std[0, 0]),
+            float(lap_std[0, 0]) ** 2,
+        )
+        if image_cache is not None:
+            image_cache[key] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "stored_at": time.time(),
+                "metrics": metrics,
+            }
+        return metrics
 
     def run(self):
         """Execute quality analysis for all images."""
-        results = []
-        total_images = len(self.image_dict)
-
-        if total_images == 0:
+        if not self.image_dict:
             self.finished_analysis.emit(pd.DataFrame())
             return
 
+        image_cache = self._open_image_cache()
+        try:
+            results = self._analyze_images(image_cache)
+        finally:
+            if image_cache is not None:
+                image_cache.close()
+
+        df = pd.DataFrame(results)
+        if not df.empty:
+            # float32 halves the bytes scanned by plotting and thresholds
+            df = df.astype(
+                {"brightness": np.float32, "contrast": np.float32, "blur_score": np.float32}
+            )
+            df["img_area"] = df["width"].astype(np.int64) * df["height"].astype(
+                np.int64
+            )
+        self.finished_analysis.emit(df)
+
+    def _analyze_images(self, image_cache):
+        """Measure every image, emitting progress; returns per-image rows."""
+        results = []
+        total_images = len(self.image_dict)
         count = 0
         for img_id, img_info in self.image_dict.items():
             if self.isInterruptionRequested():
@@ -55,12 +157,13 @@ class QualityAnalyzerThread(QThread):
 
             if os.path.exists(full_path):
                 try:
-                    img = cv2.imread(full_path, cv2.IMREAD_GRAYSCALE)
-                    if img is not None:
+                    measured = self._measure(full_path, image_cache)
+                    if measured is not None:
+                        brightness, contrast, blur_score = measured
                         metrics["file_exists"] = True
-                        metrics["brightness"] = np.mean(img)
-                        metrics["contrast"] = np.std(img)
-                        metrics["blur_score"] = cv2.Laplacian(img, cv2.CV_64F).var()
+                        metrics["brightness"] = brightness
+                        metrics["contrast"] = contrast
+                        metrics["blur_score"] = blur_score
 
                 except Exception as e:
                     print(f"Error processing {file_name}: {e}")
@@ -71,5 +174,4 @@ class QualityAnalyzerThread(QThread):
             if count % 10 == 0 or count == total_images:
                 self.progress.emit(int((count / total_images) * 100), total_images)
 
-        df = pd.DataFrame(results)
-        self.finished_analysis.emit(df)
+        return results
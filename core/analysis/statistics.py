@@ -1,6 +1,16 @@
 """Analysis utilities for object detection dataset."""
 
-from sklearn.cluster import KMeans
+from typing import NamedTuple
+
+
+class HealthError(NamedTuple):
+    """Single annotation problem reported by check_health."""
+
+    img_id: int
+    type: str
+    detail: str
+    ann_id: int
+    bbox: list
 
 
 class StatisticsAnalyzer:
@@ -19,6 +29,9 @@ class StatisticsAnalyzer:
         """
         if df.empty:
             return None, None
+        # Deferred: scikit-learn is only needed for anchor clustering
+        from sklearn.cluster import KMeans
+
         X = df[["bbox_w", "bbox_h"]].values
         kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
         kmeans.fit(X)
@@ -50,25 +63,22 @@ class StatisticsAnalyzer:
             df: DataFrame with annotations.
             images_dict: Dictionary mapping image_id to image metadata.
 
-        Returns:
-            List of error dictionaries with 'type', 'img_id', 'detail', 'bbox' keys.
+        Yields:
+            HealthError tuples (img_id, type, detail, ann_id, bbox) as they are found.
         """
-        errors = []
         if df.empty:
-            return errors
+            return
 
         # 1. Tiny Boxes
         tiny_mask = (df["bbox_w"] < 1) | (df["bbox_h"] < 1)
         tiny_boxes = df[tiny_mask]
         for _, row in tiny_boxes.iterrows():
-            errors.append(
-                {
-                    "type": "Tiny Box",
-                    "img_id": row["image_id"],
-                    "ann_id": row["id"],
-                    "detail": f"w={row['bbox_w']:.1f}, h={row['bbox_h']:.1f}",
-                    "bbox": row["bbox"],
-                }
+            yield HealthError(
+                row["image_id"],
+                "Tiny Box",
+                f"w={row['bbox_w']:.1f}, h={row['bbox_h']:.1f}",
+                row["id"],
+                row["bbox"],
             )
 
         # 2. Out of Bounds & 3. Giant Boxes
@@ -83,27 +93,21 @@ class StatisticsAnalyzer:
 
             # OOB
             if x < 0 or y < 0 or (x + w) > img_w or (y + h) > img_h:
-                errors.append(
-                    {
-                        "type": "Out of Bounds",
-                        "img_id": img_id,
-                        "ann_id": row["id"],
-                        "detail": f"Box[{x},{y},{w},{h}] vs Img[{img_w}x{img_h}]",
-                        "bbox": row["bbox"],
-                    }
+                yield HealthError(
+                    img_id,
+                    "Out of Bounds",
+                    f"Box[{x},{y},{w},{h}] vs Img[{img_w}x{img_h}]",
+                    row["id"],
+                    row["bbox"],
                 )
 
             # Giant Box
             img_area = img_w * img_h
             if img_area > 0 and (row["area"] / img_area) > 0.95:
-                errors.append(
-                    {
-                        "type": "Giant Box",
-                        "img_id": img_id,
-                        "ann_id": row["id"],
-                        "detail": f"Area Ratio: {row['area'] / img_area:.2f}",
-                        "bbox": row["bbox"],
-                    }
+                yield HealthError(
+                    img_id,
+                    "Giant Box",
+                    f"Area Ratio: {row['area'] / img_area:.2f}",
+                    row["id"],
+                    row["bbox"],
                 )
-
-        return errors
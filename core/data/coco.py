@@ -3,7 +3,7 @@ from pathlib import Path
 
 import pandas as pd
 
-from core.data.data_loader import UnifiedDataLoader
+from core.data.data_loader import BBOX_COLUMNS, UnifiedDataLoader
 
 
 class CocoDataLoader:
@@ -36,12 +36,13 @@ class CocoDataLoader:
                     img_info["abs_path"] = str(loader.img_root / img_info["file_name"])
 
         if not loader.annotations.empty:
-            loader.annotations["bbox_w"] = loader.annotations["bbox"].apply(
-                lambda x: x[2]
-            )
-            loader.annotations["bbox_h"] = loader.annotations["bbox"].apply(
-                lambda x: x[3]
+            # Unpack [x, y, w, h] lists into numeric columns in one pass
+            bbox_cols = pd.DataFrame(
+                loader.annotations["bbox"].tolist(),
+                index=loader.annotations.index,
+                columns=BBOX_COLUMNS,
             )
+            loader.annotations = loader.annotations.join(bbox_cols)
             loader.annotations["area"] = (
                 loader.annotations["bbox_w"] * loader.annotations["bbox_h"]
             )
@@ -52,7 +53,7 @@ class CocoDataLoader:
                 loader.categories
             )
         else:
-            for col in ["bbox_w", "bbox_h", "area", "aspect_ratio", "category_name"]:
+            for col in BBOX_COLUMNS + ["area", "aspect_ratio", "category_name"]:
                 loader.annotations[col] = []
 
         return loader
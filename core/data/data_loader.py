@@ -7,6 +7,9 @@ from pathlib import Path
 import pandas as pd
 import yaml
 
+# Numeric columns unpacked from each annotation's [x, y, w, h] bbox list
+BBOX_COLUMNS = ["bbox_x", "bbox_y", "bbox_w", "bbox_h"]
+
 
 class UnifiedDataLoader:
     """Common Data Loader for Object Detection Datasets."""
@@ -15,12 +18,48 @@ class UnifiedDataLoader:
         self.images = {}
         self.categories = {}
         self.annotations = pd.DataFrame()
+        # Bumped whenever annotation rows or their categories change, so
+        # views can cache per-category aggregates
+        self.annotations_version = 0
+        # Bumped whenever images are added or removed
+        self.images_version = 0
+        # (images_version, ID list, ID strings, ID frozenset)
+        self._image_id_cache = None
         self.img_root = None
         self.base_path = None  # For YOLO dataset base path
         self.excluded_image_ids = set()  # Images marked for exclusion
         self.duplicate_groups = []  # List of sets containing duplicate image IDs
         self.source_tracking = {}  # {source_name: set(image_ids)} - Track which images came from which source
 
+    def _image_id_views(self):
+        """Image IDs as list, strings and set, rebuilt only after images change."""
+        cache = self._image_id_cache
+        if cache is None or cache[0] != self.images_version:
+            ids = list(self.images)
+            cache = (
+                self.images_version,
+                ids,
+                [str(img_id) for img_id in ids],
+                frozenset(ids),
+            )
+            self._image_id_cache = cache
+        return cache
+
+    @property
+    def image_ids(self):
+        """All image IDs in insertion order. Shared; do not mutate."""
+        return self._image_id_views()[1]
+
+    @property
+    def image_id_strs(self):
+        """str() of each entry of image_ids. Shared; do not mutate."""
+        return self._image_id_views()[2]
+
+    @property
+    def image_id_set(self):
+        """Frozen set of all image IDs."""
+        return self._image_id_views()[3]
+
     def get_stats(self):
         """Get basic dataset statistics."""
         return {
@@ -88,12 +127,14 @@ class UnifiedDataLoader:
         for img_id in image_ids:
             self.images.pop(img_id, None)
             self.excluded_image_ids.discard(img_id)  # Also remove from excluded if present
+        self.images_version += 1
         
         # Remove annotations for these images
         if not self.annotations.empty:
             self.annotations = self.annotations[
                 ~self.annotations["image_id"].isin(image_ids)
             ]
+            self.annotations_version += 1
         
         # Update duplicate groups
         if self.duplicate_groups:
@@ -222,6 +263,7 @@ class UnifiedDataLoader:
                 self.excluded_image_ids.add(new_img_id)
 
             next_img_id += 1
+        self.images_version += 1
         
         # 2.5. Merge source tracking information
         for source_name, img_ids in other.source_tracking.items():
@@ -248,6 +290,7 @@ class UnifiedDataLoader:
             self.annotations = pd.concat(
                 [self.annotations, new_anns], ignore_index=True
             )
+            self.annotations_version += 1
 
     def normalize_category_ids(self):
         """Normalize category IDs to start from 0 sequentially.
@@ -302,6 +345,7 @@ class UnifiedDataLoader:
             self.annotations["category_name"] = self.annotations["category_id"].map(
                 self.categories
             )
+            self.annotations_version += 1
 
         return old_to_new_map
 
@@ -313,14 +357,22 @@ class UnifiedDataLoader:
                 # Update category_name column for consistency
                 mask = self.annotations["category_id"] == cat_id
                 self.annotations.loc[mask, "category_name"] = new_name
+                self.annotations_version += 1
 
-    def export_as_yolo(self, save_dir, split_info=None, exclude_marked=True):
+    def export_as_yolo(
+        self, save_dir, split_info=None, exclude_marked=True, progress_callback=None
+    ):
         """Export dataset in YOLO format with optional split and exclusion.
 
         Args:
             save_dir: Directory to save YOLO dataset.
             split_info: Optional dict with 'train', 'val', 'test' keys containing image IDs.
             exclude_marked: Whether to exclude images marked for deletion.
+            progress_callback: Optional callable(current, total) called after each
+                image. Returning False stops the export early.
+
+        Returns:
+            True if the export completed, False if it was stopped by the callback.
         """
         save_dir = Path(save_dir)
         save_dir.mkdir(parents=True, exist_ok=True)
@@ -365,6 +417,8 @@ class UnifiedDataLoader:
                 (save_dir / "labels" / split_name).mkdir(parents=True, exist_ok=True)
 
             # Export by split
+            total = sum(len(img_ids) for img_ids in splits.values())
+            done = 0
             for split_name, img_ids in splits.items():
                 for img_id in img_ids:
                     self._export_yolo_image(
@@ -374,6 +428,9 @@ class UnifiedDataLoader:
                         save_dir / "labels" / split_name,
                         anns_by_img,
                     )
+                    done += 1
+                    if progress_callback and progress_callback(done, total) is False:
+                        return False
 
             # Create data.yaml with splits
             yaml_content = {
@@ -390,10 +447,13 @@ class UnifiedDataLoader:
             images_dir.mkdir(parents=True, exist_ok=True)
             labels_dir.mkdir(parents=True, exist_ok=True)
 
-            for img_id, img_info in exportable_imgs.items():
+            total = len(exportable_imgs)
+            for done, (img_id, img_info) in enumerate(exportable_imgs.items(), 1):
                 self._export_yolo_image(
                     img_id, img_info, images_dir, labels_dir, anns_by_img
                 )
+                if progress_callback and progress_callback(done, total) is False:
+                    return False
 
             # Create data.yaml without splits
             yaml_content = {
@@ -406,6 +466,7 @@ class UnifiedDataLoader:
         # Write data.yaml
         with open(save_dir / "data.yaml", "w") as f:
             yaml.dump(yaml_content, f, sort_keys=False)
+        return True
 
     def _export_yolo_image(self, img_id, img_info, images_dir, labels_dir, anns_by_img):
         """Helper to export a single image and its label in YOLO format."""
@@ -459,13 +520,20 @@ class UnifiedDataLoader:
         with open(label_path, "w") as f:
             f.write("\n".join(label_lines))
 
-    def export_as_coco(self, save_path, split_info=None, exclude_marked=True):
+    def export_as_coco(
+        self, save_path, split_info=None, exclude_marked=True, progress_callback=None
+    ):
         """Export dataset in COCO format with optional split and exclusion.
 
         Args:
             save_path: Path for JSON file. If splits are used, this is treated as a directory.
             split_info: Optional dict with 'train', 'val', 'test' keys containing image IDs.
             exclude_marked: Whether to exclude images marked for deletion.
+            progress_callback: Optional callable(current, total) called after each
+                image. Returning False stops the export early.
+
+        Returns:
+            True if the export completed, False if it was stopped by the callback.
         """
         save_path = Path(save_path)
 
@@ -484,7 +552,7 @@ class UnifiedDataLoader:
         ]
 
         # Derived columns to remove from annotations
-        derived_cols = ["bbox_w", "bbox_h", "area", "aspect_ratio", "category_name"]
+        derived_cols = BBOX_COLUMNS + ["area", "aspect_ratio", "category_name"]
 
         if split_info and any(split_info.values()):
             # With splits - save_path is treated as directory
@@ -495,13 +563,17 @@ class UnifiedDataLoader:
             )
             save_dir.mkdir(parents=True, exist_ok=True)
 
+            split_img_id_sets = {}
             for split_name in ["train", "val", "test"]:
                 if split_name not in split_info or not split_info[split_name]:
                     continue
-
-                split_img_ids = set(split_info[split_name]) & set(
+                split_img_id_sets[split_name] = set(split_info[split_name]) & set(
                     exportable_imgs.keys()
                 )
+            total = sum(len(img_ids) for img_ids in split_img_id_sets.values())
+            done = 0
+
+            for split_name, split_img_ids in split_img_id_sets.items():
                 if not split_img_ids:
                     continue
 
@@ -522,6 +594,9 @@ class UnifiedDataLoader:
                     self._copy_image_file(
                         img_id, exportable_imgs[img_id], split_images_dir
                     )
+                    done += 1
+                    if progress_callback and progress_callback(done, total) is False:
+                        return False
 
                 # Filter annotations for this split
                 if not self.annotations.empty:
@@ -560,7 +635,8 @@ class UnifiedDataLoader:
 
             # Prepare images
             coco_images = []
-            for img_id, img_info in exportable_imgs.items():
+            total = len(exportable_imgs)
+            for done, (img_id, img_info) in enumerate(exportable_imgs.items(), 1):
                 img_copy = img_info.copy()
                 img_copy["file_name"] = Path(img_copy["file_name"]).name
                 if "abs_path" in img_copy:
@@ -569,6 +645,8 @@ class UnifiedDataLoader:
 
                 # Copy image file
                 self._copy_image_file(img_id, img_info, images_dir)
+                if progress_callback and progress_callback(done, total) is False:
+                    return False
 
             # Prepare annotations (filter to only exportable images)
             if not self.annotations.empty:
@@ -592,6 +670,7 @@ class UnifiedDataLoader:
             # Save JSON
             with open(save_path, "w") as f:
                 json.dump(coco_dict, f, indent=2)
+        return True
 
     def _copy_image_file(self, img_id, img_info, dest_dir):
         """Helper to copy image file to destination directory."""
@@ -0,0 +1,52 @@
+"""Background dataset export in YOLO or COCO format."""
+
+from PySide6.QtCore import QThread, Signal
+
+
+class DatasetExportThread(QThread):
+    """Thread for exporting a dataset off the GUI thread."""
+
+    progress = Signal(int, int)  # current, total
+    finished_export = Signal(bool)  # True if completed, False if cancelled
+    error_occurred = Signal(str)
+
+    def __init__(
+        self, loader, export_format, save_path, split_info=None, exclude_marked=True
+    ):
+        """Initialize export thread.
+
+        Args:
+            loader: UnifiedDataLoader instance to export.
+            export_format: "YOLO" or "COCO".
+            save_path: Target directory (YOLO, COCO with splits) or JSON path (COCO).
+            split_info: Optional dict with 'train', 'val', 'test' image ID lists.
+            exclude_marked: Whether to exclude images marked for deletion.
+        """
+        super().__init__()
+        self.loader = loader
+        self.export_format = export_format
+        self.save_path = save_path
+        self.split_info = split_info
+        self.exclude_marked = exclude_marked
+
+    def _report_progress(self, current, total):
+        self.progress.emit(current, total)
+        return not self.isInterruptionRequested()
+
+    def run(self):
+        """Execute the export, reporting per-image progress."""
+        try:
+            if self.export_format == "YOLO":
+                export = self.loader.export_as_yolo
+            else:
+                export = self.loader.export_as_coco
+
+            completed = export(
+                self.save_path,
+                split_info=self.split_info,
+                exclude_marked=self.exclude_marked,
+                progress_callback=self._report_progress,
+            )
+            self.finished_export.emit(completed)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
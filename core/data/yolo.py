@@ -4,7 +4,7 @@ import cv2
 import pandas as pd
 import yaml
 
-from core.data.data_loader import UnifiedDataLoader
+from core.data.data_loader import BBOX_COLUMNS, UnifiedDataLoader
 
 
 class YoloDataLoader:
@@ -195,12 +195,13 @@ class YoloDataLoader:
         loader.annotations = pd.DataFrame(annotations_list)
 
         if not loader.annotations.empty:
-            loader.annotations["bbox_w"] = loader.annotations["bbox"].apply(
-                lambda x: x[2]
-            )
-            loader.annotations["bbox_h"] = loader.annotations["bbox"].apply(
-                lambda x: x[3]
+            # Unpack [x, y, w, h] lists into numeric columns in one pass
+            bbox_cols = pd.DataFrame(
+                loader.annotations["bbox"].tolist(),
+                index=loader.annotations.index,
+                columns=BBOX_COLUMNS,
             )
+            loader.annotations = loader.annotations.join(bbox_cols)
             loader.annotations["area"] = (
                 loader.annotations["bbox_w"] * loader.annotations["bbox_h"]
             )
@@ -219,7 +220,7 @@ class YoloDataLoader:
                     "category_id"
                 ].astype(str)
         else:
-            for col in ["bbox_w", "bbox_h", "area", "aspect_ratio", "category_name"]:
+            for col in BBOX_COLUMNS + ["area", "aspect_ratio", "category_name"]:
                 loader.annotations[col] = []
 
         return loader
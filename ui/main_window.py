@@ -175,8 +175,7 @@ class MainWindow(QMainWindow):
         
         # Reset all widgets
         self.overview_tab.update_data(None)
-        self.stat_tab.figure.clear()
-        self.stat_tab.canvas.draw()
+        self.stat_tab.clear_plot()
         self.geo_tab.update_data(None)
         self.spatial_tab.update_data(None)
         self.rel_tab.update_data(None)
@@ -0,0 +1,143 @@
+"""Chart display that rasterizes a Matplotlib figure off the GUI thread."""
+
+import threading
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PySide6.QtCore import QCoreApplication, Qt, QThread, QTimer, Signal
+from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtWidgets import QLabel, QSizePolicy
+
+# Matplotlib is not thread-safe, even across separate figures (shared font
+# and text caches); renders from all ChartViews run one at a time
+_RENDER_LOCK = threading.Lock()
+
+# Render threads, retained here rather than only by their ChartView so a
+# view destroyed mid-render does not destroy a running QThread (which aborts
+# the process). Finished ones are released on the next render; the rest are
+# waited for on quit.
+_render_workers = []
+
+
+def _wait_for_renders():
+    for worker in _render_workers:
+        worker.wait()
+
+
+class FigureRenderThread(QThread):
+    """Thread that runs plotting callables on a figure and rasterizes it."""
+
+    finished_render = Signal(object)  # QImage
+    error_occurred = Signal(str)
+
+    def __init__(self, figure, draw_fns):
+        """Initialize render thread.
+
+        Args:
+            figure: Figure attached to a FigureCanvasAgg.
+            draw_fns: Callables taking no arguments that plot into figure.
+        """
+        super().__init__()
+        self.figure = figure
+        self.draw_fns = draw_fns
+
+    def run(self):
+        try:
+            with _RENDER_LOCK:
+                for draw in self.draw_fns:
+                    draw()
+                canvas = self.figure.canvas
+                canvas.draw()
+                width, height = canvas.get_width_height(physical=True)
+                # copy() detaches the image from the Agg buffer before the
+                # next draw
+                image = QImage(
+                    canvas.buffer_rgba(), width, height, QImage.Format_RGBA8888
+                ).copy()
+            self.finished_render.emit(image)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+
+class ChartView(QLabel):
+    """Shows a figure that is drawn and rasterized in a FigureRenderThread.
+
+    The figure is only touched by one render thread at a time; plotting code
+    passed to redraw() must not use Qt widgets. Data bound into that code
+    must not be mutated while it is queued, so callers pass snapshots rather
+    than live loader frames.
+    """
+
+    _quit_hook_installed = False
+
+    BASE_DPI = 100
+    RESIZE_DELAY_MS = 150
+
+    def __init__(self, figsize=(10, 5), parent=None):
+        super().__init__(parent)
+        # Tight layout is reapplied on every draw, including resizes
+        self.figure = Figure(figsize=figsize, dpi=self.BASE_DPI, layout="tight")
+        FigureCanvasAgg(self.figure)
+        self.worker = None
+        self._rendering = False
+        self._pending = []
+        self._rerender = False
+
+        self.setAlignment(Qt.AlignCenter)
+        self.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        self.setMinimumSize(200, 150)
+
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self.redraw)
+
+        if not ChartView._quit_hook_installed:
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(_wait_for_renders)
+                ChartView._quit_hook_installed = True
+
+    def redraw(self, draw=None):
+        """Queue draw (if given) and re-rasterize the figure in a worker."""
+        if draw is not None:
+            self._pending.append(draw)
+        if self._rendering:
+            # Picked up once the running render finishes
+            self._rerender = True
+            return
+
+        # Match the widget size; scale dpi so text keeps its size on HiDPI
+        self.figure.set_dpi(self.BASE_DPI * self.devicePixelRatioF())
+        self.figure.set_size_inches(
+            self.width() / self.BASE_DPI, self.height() / self.BASE_DPI
+        )
+
+        draw_fns, self._pending = self._pending, []
+        self._rendering = True
+        self.worker = FigureRenderThread(self.figure, draw_fns)
+        self.worker.finished_render.connect(self.on_render_finished)
+        self.worker.error_occurred.connect(self.on_render_error)
+        self.worker.finished.connect(self._on_worker_done)
+        # Release renders that are done before tracking a new one
+        _render_workers[:] = [w for w in _render_workers if not w.isFinished()]
+        _render_workers.append(self.worker)
+        self.worker.start()
+
+    def on_render_finished(self, image):
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        self.setPixmap(pixmap)
+
+    def on_render_error(self, error_msg):
+        self.setText(f"Failed to draw chart: {error_msg}")
+
+    def _on_worker_done(self):
+        self._rendering = False
+        if self._rerender:
+            self._rerender = False
+            self.redraw()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # Re-rasterize at the new size once resizing settles
+        self._resize_timer.start(self.RESIZE_DELAY_MS)
@@ -1,84 +1,13 @@
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QTextCursor
-from PySide6.QtWidgets import QScrollArea, QTextEdit, QVBoxLayout, QWidget
-
-
-class GuideWidget(QWidget):
-    def __init__(self):
-        super().__init__()
-        self.text_edit = None
-        self.initUI()
-
-    def initUI(self):
-        layout = QVBoxLayout(self)
-
-        # Scrollable content
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+import re
 
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
-
-        # Guide content
-        guide_text = self.generate_guide_text()
-        self.text_edit = QTextEdit()
-        self.text_edit.setReadOnly(True)
-        self.text_edit.setMarkdown(guide_text)
-        self.text_edit.setStyleSheet(
-            """
-            QTextEdit {
-                font-size: 12px;
-                line-height: 1.6;
-                padding: 10px;
-            }
-        """
-        )
-
-        content_layout.addWidget(self.text_edit)
-        scroll.setWidget(content_widget)
-        layout.addWidget(scroll)
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QTextCharFormat, QTextCursor
+from PySide6.QtWidgets import QScrollArea, QTextBrowser, QVBoxLayout, QWidget
 
-    def scroll_to_section(self, section_name):
-        """Scroll to a specific section in the guide"""
-        if not self.text_edit:
-            return
+# Trailing "{#anchor}" marker on guide headings
+_ANCHOR_RE = re.compile(r"\s*\{#([\w-]+)\}\s*$")
 
-        # Map section names to search terms
-        section_map = {
-            "overview": "Overview Tab",
-            "dashboard": "Dashboard Tab",
-            "geometry": "Geometry Analysis Tab",
-            "spatial": "Spatial Analysis Tab",
-            "relation": "Class Relation Analysis Tab",
-            "difficulty": "Difficulty Analysis Tab",
-            "duplicates": "Duplicate Detection Tab",
-            "health": "Data Health Check Tab",
-            "quality": "Image Quality Tab",
-            "strategy": "Training Strategy Tab",
-            "signal": "Signal Analysis Tab",
-            "viewer": "Visual Explorer Tab",
-        }
-
-        search_text = section_map.get(section_name.lower(), section_name)
-
-        # Find the section
-        cursor = self.text_edit.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.Start)
-        self.text_edit.setTextCursor(cursor)
-
-        # Search for the section header
-        found = self.text_edit.find(search_text)
-        if found:
-            # Move cursor to beginning of line
-            cursor = self.text_edit.textCursor()
-            cursor.movePosition(QTextCursor.MoveOperation.StartOfLine)
-            self.text_edit.setTextCursor(cursor)
-            # Scroll to make it visible
-            self.text_edit.ensureCursorVisible()
-
-    def generate_guide_text(self):
-        return """
+_GUIDE_MD = """
 # 📖 Object Detection EDA Tool - User Guide
 
 This guide explains the meaning of metrics and visualizations across all analysis tabs.
@@ -468,3 +397,76 @@ This tab analyzes your dataset and provides:
 
 *For questions or issues, refer to the project documentation or create an issue on the repository.*
 """
+
+
+class GuideWidget(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.text_edit = None
+        self.initUI()
+
+    def initUI(self):
+        layout = QVBoxLayout(self)
+
+        # Scrollable content
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+        content_widget = QWidget()
+        content_layout = QVBoxLayout(content_widget)
+
+        # Guide content
+        self.text_edit = QTextBrowser()
+        self.text_edit.setOpenExternalLinks(True)
+        self.text_edit.setMarkdown(_GUIDE_MD)
+        self._install_section_anchors()
+        self.text_edit.setStyleSheet(
+            """
+            QTextBrowser {
+                font-size: 12px;
+                line-height: 1.6;
+                padding: 10px;
+            }
+        """
+        )
+
+        content_layout.addWidget(self.text_edit)
+        scroll.setWidget(content_widget)
+        layout.addWidget(scroll)
+
+    def _install_section_anchors(self):
+        """Turn trailing {#anchor} markers on headings into named anchors.
+
+        Qt's markdown importer keeps the markers as literal text, so strip them
+        and tag the heading with the anchor name for scrollToAnchor.
+        """
+        document = self.text_edit.document()
+        block = document.begin()
+        while block.isValid():
+            match = _ANCHOR_RE.search(block.text())
+            if match:
+                # Positions are UTF-16 based, so measure from the block end
+                # (the marker itself is plain ASCII)
+                block_end = block.position() + block.length() - 1
+                cursor = QTextCursor(block)
+                cursor.setPosition(block_end - len(match.group(0)))
+                cursor.setPosition(block_end, QTextCursor.MoveMode.KeepAnchor)
+                cursor.removeSelectedText()
+
+                cursor.movePosition(
+                    QTextCursor.MoveOperation.StartOfBlock,
+                    QTextCursor.MoveMode.KeepAnchor,
+                )
+                fmt = QTextCharFormat()
+                fmt.setAnchor(True)
+                fmt.setAnchorNames([match.group(1)])
+                cursor.mergeCharFormat(fmt)
+            block = block.next()
+
+    def scroll_to_section(self, section_name):
+        """Scroll to a specific section in the guide"""
+        if not self.text_edit:
+            return
+
+        self.text_edit.scrollToAnchor(section_name.lower())
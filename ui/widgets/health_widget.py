@@ -1,26 +1,192 @@
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QAbstractTableModel, QEvent, QModelIndex, Qt, Signal
+from PySide6.QtGui import QBrush
 from PySide6.QtWidgets import (
     QApplication,
-    QCheckBox,
     QGroupBox,
     QHBoxLayout,
     QHeaderView,
     QLabel,
+    QMessageBox,
     QProgressDialog,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
-from core.analysis.statistics import StatisticsAnalyzer
+# Shared brushes for rows of images marked for exclusion
+_EXCLUDED_BACKGROUND = QBrush(Qt.red)
+_EXCLUDED_FOREGROUND = QBrush(Qt.white)
+
+
+class ViewButtonDelegate(QStyledItemDelegate):
+    """Paints a "View" button in a cell instead of a per-row QPushButton."""
+
+    view_requested = Signal(object)  # img_id stored under Qt.UserRole
+
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.text = "View"
+        button.state = QStyle.State_Enabled
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        if (
+            event.type() == QEvent.MouseButtonRelease
+            and event.button() == Qt.LeftButton
+            and option.rect.contains(event.position().toPoint())
+        ):
+            self.view_requested.emit(index.data(Qt.UserRole))
+            return True
+        return False
+
+
+class HealthModel(QAbstractTableModel):
+    """Table model over check_health results.
+
+    Cells are read from the error list on demand; the marking column and the
+    row highlighting are derived from the loader's excluded_image_ids.
+    """
+
+    HEADERS = [
+        "Marked for deletion",
+        "Error Type",
+        "Image ID",
+        "BBox / Details",
+        "Action",
+    ]
+
+    exclusion_changed = Signal(object, bool)  # img_id, is_excluded
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._loader = None
+        self._excluded = frozenset()
+        self._errors = []
+        self._rows_by_img = {}  # img_id -> rows referencing that image
+
+    def set_loader(self, loader):
+        self.beginResetModel()
+        self._loader = loader
+        # Live reference (the loader mutates this set in place); a frozen
+        # snapshot would go stale when other tabs toggle exclusions
+        self._excluded = loader.excluded_image_ids if loader else frozenset()
+        self._errors = []
+        self._rows_by_img = {}
+        self.endResetModel()
+
+    def set_errors(self, errors):
+        self.beginResetModel()
+        self._errors = errors
+        self._rows_by_img = {}
+        for row, err in enumerate(errors):
+            self._rows_by_img.setdefault(err.img_id, []).append(row)
+        self.endResetModel()
+
+    def append_errors(self, errors):
+        if not errors:
+            return
+        first = len(self._errors)
+        self.beginInsertRows(QModelIndex(), first, first + len(errors) - 1)
+        append = self._errors.append
+        rows_by_img = self._rows_by_img
+        for row, err in enumerate(errors, first):
+            append(err)
+            rows_by_img.setdefault(err.img_id, []).append(row)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._errors)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def _is_excluded(self, img_id):
+        return img_id in self._excluded
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        err = self._errors[index.row()]
+        col = index.column()
+
+        if role == Qt.UserRole:
+            return err.img_id
+
+        if col == 0:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if self._is_excluded(err.img_id) else Qt.Unchecked
+            return None
+
+        if col == 4:
+            return None
+
+        if role == Qt.DisplayRole:
+            if col == 1:
+                return err.type
+            if col == 2:
+                return str(err.img_id)
+            return err.detail
+
+        # Highlight rows of excluded images
+        if role == Qt.BackgroundRole:
+            return _EXCLUDED_BACKGROUND if self._is_excluded(err.img_id) else None
+        if role == Qt.ForegroundRole:
+            return _EXCLUDED_FOREGROUND if self._is_excluded(err.img_id) else None
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == 0:
+            return Qt.ItemIsUserCheckable | Qt.ItemIsEnabled
+        if index.column() == 4:
+            return Qt.ItemIsEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if (
+            not index.isValid()
+            or index.column() != 0
+            or role != Qt.CheckStateRole
+            or self._loader is None
+        ):
+            return False
+
+        img_id = self._errors[index.row()].img_id
+        is_excluded = Qt.CheckState(value) == Qt.Checked
+        if is_excluded:
+            self._loader.mark_image_for_exclusion(img_id)
+        else:
+            self._loader.unmark_image_for_exclusion(img_id)
+
+        # Every row of this image changes state, not just the clicked one
+        for row in self._rows_by_img.get(img_id, ()):
+            self.dataChanged.emit(self.index(row, 0), self.index(row, 3))
+        self.exclusion_changed.emit(img_id, is_excluded)
+        return True
 
 
 class HealthWidget(QWidget):
     def __init__(self, data_loader=None):
         super().__init__()
         self.loader = data_loader
+        self.worker = None
+        # Stopped scans still running; referenced until they finish, since
+        # destroying a running QThread aborts the process
+        self._stopped_workers = []
+        self.loading_dialog = None
         self.initUI()
 
     def initUI(self):
@@ -44,20 +210,21 @@ class HealthWidget(QWidget):
 
         layout.addWidget(top_panel)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(
-            [
-                "Marked for deletion",
-                "Error Type",
-                "Image ID",
-                "BBox / Details",
-                "Action",
-            ]
+        self.model = HealthModel(self)
+        self.model.set_loader(self.loader)
+        self.model.exclusion_changed.connect(
+            lambda img_id, is_excluded: self.update_marked_count()
         )
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setColumnWidth(0, 80)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
+        self.view_delegate = ViewButtonDelegate(self.table)
+        self.view_delegate.view_requested.connect(self.open_viewer)
+        self.table.setItemDelegateForColumn(4, self.view_delegate)
+
         layout.addWidget(self.table)
 
         # Guide button at bottom
@@ -75,13 +242,16 @@ class HealthWidget(QWidget):
 
     def update_data(self, data_loader):
         self.loader = data_loader
-        self.table.setRowCount(0)
+        self._stop_worker()
+        self.model.set_loader(data_loader)
         self.lbl_summary.setText("Data loaded. Click Scan to check health.")
 
     def run_scan(self):
         if not self.loader:
             return
 
+        self._stop_worker()
+
         # Show modal loading dialog
         self.loading_dialog = QProgressDialog(
             "Scanning for data health issues...\n\n"
@@ -95,87 +265,67 @@ class HealthWidget(QWidget):
         self.loading_dialog.setMinimumDuration(0)
         self.loading_dialog.setRange(0, 0)
         self.loading_dialog.show()
-        QApplication.processEvents()
-
-        self.table.setRowCount(0)
-        errors = StatisticsAnalyzer.check_health(
-            self.loader.annotations, self.loader.images
-        )
-        
-        # Close loading dialog
-        self.loading_dialog.close()
-
-        self.table.setRowCount(len(errors))
-
-        for i, err in enumerate(errors):
-            img_id = err["img_id"]
-            is_excluded = img_id in self.loader.excluded_image_ids
-
-            # Checkbox for marking IMAGE (not bbox)
-            chk = QCheckBox()
-            chk.setProperty("img_id", img_id)
-            chk.setChecked(is_excluded)
-            chk.stateChanged.connect(self.on_checkbox_state_changed)
-            self.table.setCellWidget(i, 0, chk)
-
-            # Error type
-            self.table.setItem(i, 1, QTableWidgetItem(err["type"]))
 
-            # Image ID
-            self.table.setItem(i, 2, QTableWidgetItem(str(img_id)))
-
-            # Details
-            self.table.setItem(i, 3, QTableWidgetItem(err["detail"]))
+        self.btn_scan.setEnabled(False)
+        self.model.set_errors([])
+
+        # Imported on first scan; pulls in the analysis stack
+        from core.analysis.health import HealthCheckThread
+
+        self.worker = HealthCheckThread(self.loader.annotations, self.loader.images)
+        self.worker.batch_found.connect(self.on_scan_batch)
+        self.worker.finished_analysis.connect(self.on_scan_finished)
+        self.worker.error_occurred.connect(self.on_scan_error)
+        self.worker.start()
+
+    def _stop_worker(self):
+        """Detach a running scan so its late batches are ignored."""
+        if self.worker is not None:
+            worker = self.worker
+            self.worker = None
+            worker.requestInterruption()
+            if not worker.isFinished():
+                self._stopped_workers.append(worker)
+                worker.finished.connect(self._release_stopped_worker)
+
+        # The detached scan will never report back; reset its UI here
+        if self.loading_dialog is not None:
+            self.loading_dialog.close()
+        self.btn_scan.setEnabled(True)
+
+    def _release_stopped_worker(self):
+        worker = self.sender()
+        if worker in self._stopped_workers:
+            self._stopped_workers.remove(worker)
+
+    def on_scan_batch(self, errors):
+        if self.sender() is not self.worker:
+            return
 
-            # View button
-            btn_view = QPushButton("View")
-            btn_view.clicked.connect(lambda checked, eid=img_id: self.open_viewer(eid))
-            self.table.setCellWidget(i, 4, btn_view)
+        # Results stream in while scanning; show them as soon as they arrive
+        self.loading_dialog.close()
+        self.model.append_errors(errors)
+        self.lbl_summary.setText(
+            f"Scanning... Found {self.model.rowCount()} issues so far."
+        )
 
-            # Highlight if excluded
-            if is_excluded:
-                self.update_row_highlighting(i, True)
+    def on_scan_finished(self, total):
+        if self.sender() is not self.worker:
+            return
 
-        self.lbl_summary.setText(f"Scan Complete. Found {len(errors)} issues.")
+        self.loading_dialog.close()
+        self.btn_scan.setEnabled(True)
+        self.lbl_summary.setText(f"Scan Complete. Found {total} issues.")
         self.update_marked_count()
 
-    def on_checkbox_state_changed(self, state):
-        """Handle checkbox state change for marking images."""
-        sender = self.sender()
-        if not isinstance(sender, QCheckBox) or not self.loader:
+    def on_scan_error(self, error_msg):
+        if self.sender() is not self.worker:
             return
 
-        try:
-            img_id = int(sender.property("img_id"))
-        except (ValueError, TypeError):
-            return
-
-        # Mark/unmark image
-        if state == 2:
-            self.loader.mark_image_for_exclusion(img_id)
-        else:
-            self.loader.unmark_image_for_exclusion(img_id)
-
-        # Update UI
-        self.update_marked_count()
-
-        # Update row highlighting for this img_id
-        for row in range(self.table.rowCount()):
-            widget = self.table.cellWidget(row, 0)
-            if widget and widget.property("img_id") == img_id:
-                self.update_row_highlighting(row, state == 2)
-
-    def update_row_highlighting(self, row, is_excluded):
-        """Update highlighting for a specific row."""
-        for col in range(1, 4):  # Exclude checkbox and view button columns
-            item = self.table.item(row, col)
-            if item:
-                if is_excluded:
-                    item.setBackground(Qt.red)
-                    item.setForeground(Qt.white)
-                else:
-                    item.setBackground(Qt.transparent)
-                    item.setForeground(Qt.black)
+        self.loading_dialog.close()
+        self.btn_scan.setEnabled(True)
+        self.lbl_summary.setText(f"Error: {error_msg}")
+        QMessageBox.critical(self, "Error", f"Health scan failed: {error_msg}")
 
     def update_marked_count(self):
         """Update the marked images counter."""
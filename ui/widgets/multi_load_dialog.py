@@ -1,5 +1,8 @@
 """Dialog for loading multiple COCO datasets."""
 
+import os
+
+from PySide6.QtCore import QThread, Signal
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QCheckBox,
@@ -8,56 +11,34 @@ from PySide6.QtWidgets import (
     QFileDialog,
     QGroupBox,
     QHBoxLayout,
-    QListWidget,
+    QLabel,
     QListView,
-    QTreeView,
+    QListWidget,
     QPushButton,
+    QTreeView,
     QVBoxLayout,
-    QWidget,
-    QLabel,
 )
-import os
 
+# Filters still running when their dialog closed. Kept referenced until they
+# finish, since destroying a running QThread aborts the process.
+_orphaned_filters = []
 
-class FileDropListWidget(QListWidget):
-    """ListWidget that accepts dropped directories."""
 
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setAcceptDrops(True)
-        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+class DirectoryFilterThread(QThread):
+    """Thread for checking dropped paths on disk off the GUI thread."""
 
-    def dragEnterEvent(self, event):
-        if event.mimeData().hasUrls():
-            event.accept()
-        else:
-            event.ignore()
+    finished_filtering = Signal(list)  # paths that are directories
 
-    def dragMoveEvent(self, event):
-        if event.mimeData().hasUrls():
-            event.accept()
-        else:
-            event.ignore()
+    def __init__(self, paths):
+        super().__init__()
+        self.paths = paths
+
+    def run(self):
+        # isdir can block for a long time on network mounts
+        self.finished_filtering.emit(
+            [path for path in self.paths if os.path.isdir(path)]
+        )
 
-    def dropEvent(self, event):
-        if event.mimeData().hasUrls():
-            event.accept()
-            # Get parent dialog to access selected_dirs logic
-            # This assumes the parent or grandparent is MultiDatasetLoadDialog
-            # But better to emit a signal or just handle items directly if possible.
-            # We can't easily access 'selected_dirs' list from here without coupling.
-            # So we will emit a signal that the parent connects to? Or just add items.
-            # Wait, the parent maintains `selected_dirs` list. We should update it.
-            
-            # Alternative: The parent implements drop logic? No, drag events go to the widget.
-            # Let's just add items here and let parent sync, or let parent handle dropping.
-            # Easier: Parent assigns a callback or we emit a signal.
-            pass  # Implemented in parent's event filter or simply here if we pass callback.
-            
-    # Actually, it is cleaner to implement drag events in the QListWidget subclass 
-    # and expose a signal 'filesDropped'
-    
-from PySide6.QtCore import Signal
 
 class FileDropListWidget(QListWidget):
     """ListWidget that accepts dropped directories."""
@@ -84,11 +65,12 @@ class FileDropListWidget(QListWidget):
     def dropEvent(self, event):
         if event.mimeData().hasUrls():
             event.accept()
-            paths = []
-            for url in event.mimeData().urls():
-                path = url.toLocalFile()
-                if os.path.isdir(path):
-                    paths.append(path)
+            # Raw local paths only; directory checks happen off the GUI thread
+            paths = [
+                path
+                for path in (url.toLocalFile() for url in event.mimeData().urls())
+                if path
+            ]
             if paths:
                 self.filesDropped.emit(paths)
 
@@ -101,6 +83,8 @@ class MultiDatasetLoadDialog(QDialog):
         self.setWindowTitle("Load Multiple COCO Datasets")
         self.resize(600, 450)
         self.selected_dirs = []
+        self._selected_set = set()  # Mirrors selected_dirs for O(1) dedup
+        self._drop_workers = []
         self.initUI()
 
     def initUI(self):
@@ -114,17 +98,22 @@ class MultiDatasetLoadDialog(QDialog):
         self.list_dirs.filesDropped.connect(self.add_dropped_dirs)
         dir_layout.addWidget(self.list_dirs)
         
-        lbl_hint = QLabel("💡 Tip: Drag and drop folders here or use 'Add Directories'")
+        lbl_hint = QLabel(
+            "💡 Tip: Drag and drop folders here or use 'Add Directory' / 'Add Multiple...'"
+        )
         lbl_hint.setStyleSheet("color: gray; font-size: 11px;")
         dir_layout.addWidget(lbl_hint)
 
         btn_layout = QHBoxLayout()
-        self.btn_add = QPushButton("Add Directories")
+        self.btn_add = QPushButton("Add Directory")
         self.btn_add.clicked.connect(self.add_directory)
+        self.btn_add_multi = QPushButton("Add Multiple...")
+        self.btn_add_multi.clicked.connect(self.add_directories)
         self.btn_remove = QPushButton("Remove Selected")
         self.btn_remove.clicked.connect(self.remove_directory)
         
         btn_layout.addWidget(self.btn_add)
+        btn_layout.addWidget(self.btn_add_multi)
         btn_layout.addWidget(self.btn_remove)
         dir_layout.addLayout(btn_layout)
         
@@ -162,22 +151,47 @@ class MultiDatasetLoadDialog(QDialog):
         self.button_box.rejected.connect(self.reject)
         layout.addWidget(self.button_box)
 
-    def add_dropped_dirs(self, paths):
-        """Handle directories dropped onto the list."""
+    def _add_paths(self, paths):
+        """Append directories to the list, skipping ones already selected."""
+        new_paths = []
         for path in paths:
-            if path not in self.selected_dirs:
-                self.selected_dirs.append(path)
-                self.list_dirs.addItem(path)
+            if path not in self._selected_set:
+                self._selected_set.add(path)
+                new_paths.append(path)
+        if not new_paths:
+            return
+
+        self.selected_dirs.extend(new_paths)
+        # Add in one call with updates off so the list repaints once
+        self.list_dirs.setUpdatesEnabled(False)
+        self.list_dirs.addItems(new_paths)
+        self.list_dirs.setUpdatesEnabled(True)
+
+    def add_dropped_dirs(self, paths):
+        """Handle paths dropped onto the list; only directories are added."""
+        # Release filters that are done before starting a new one
+        self._drop_workers = [w for w in self._drop_workers if not w.isFinished()]
+
+        worker = DirectoryFilterThread(paths)
+        worker.finished_filtering.connect(self._add_paths)
+        self._drop_workers.append(worker)
+        worker.start()
 
     def add_directory(self):
-        """Open file dialog to select one or multiple directories."""
+        """Open the native directory dialog to add a single directory."""
+        path = QFileDialog.getExistingDirectory(self, "Select Root Directory")
+        if path:
+            self._add_paths([path])
+
+    def add_directories(self):
+        """Open file dialog to select multiple directories at once."""
         # Use QFileDialog instance to enable multi-selection of directories
         dialog = QFileDialog(self, "Select Root Directories")
         dialog.setFileMode(QFileDialog.Directory)
         dialog.setOption(QFileDialog.ShowDirsOnly, True)
         
-        # Try to enable multiple selection
-        # Note: This often requires using the non-native dialog
+        # Native dialogs cannot select several directories, so this path
+        # needs Qt's own (slower) dialog
         dialog.setOption(QFileDialog.DontUseNativeDialog, True)
         
         # Find the view to set selection mode
@@ -190,11 +204,7 @@ class MultiDatasetLoadDialog(QDialog):
             tree.setSelectionMode(QAbstractItemView.ExtendedSelection)
             
         if dialog.exec():
-            paths = dialog.selectedFiles()
-            for path in paths:
-                if path not in self.selected_dirs:
-                    self.selected_dirs.append(path)
-                    self.list_dirs.addItem(path)
+            self._add_paths(dialog.selectedFiles())
 
     def remove_directory(self):
         """Remove selected directories from list."""
@@ -206,10 +216,21 @@ class MultiDatasetLoadDialog(QDialog):
         for item in selected_items:
             row = self.list_dirs.row(item)
             path = item.text()
-            if path in self.selected_dirs:
+            if path in self._selected_set:
+                self._selected_set.discard(path)
                 self.selected_dirs.remove(path)
             self.list_dirs.takeItem(row)
 
+    def done(self, result):
+        """Close the dialog, handing unfinished path filters off to finish."""
+        _orphaned_filters[:] = [w for w in _orphaned_filters if not w.isFinished()]
+        for worker in self._drop_workers:
+            if not worker.isFinished():
+                worker.finished_filtering.disconnect(self._add_paths)
+                _orphaned_filters.append(worker)
+        self._drop_workers = []
+        super().done(result)
+
     def get_config(self):
         """Get the dialog configuration."""
         splits = []
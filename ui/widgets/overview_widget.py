@@ -1,6 +1,9 @@
 """Overview widget for dataset summary and management."""
 
-from PySide6.QtCore import Qt
+import weakref
+from itertools import islice
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 from PySide6.QtWidgets import (
     QDialog,
     QFileDialog,
@@ -11,16 +14,139 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QProgressDialog,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from core.data.dataset_splitter import split_dataset
+from core.data.exporter import DatasetExportThread
 from ui.widgets.export_dialog import ExportDialog
 from ui.widgets.selective_clear_dialog import SelectiveClearDialog
 
+# Item flags for the class table, computed once
+READONLY_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+EDITABLE_FLAGS = READONLY_FLAGS | Qt.ItemIsEditable
+
+
+class CategoryTableModel(QAbstractTableModel):
+    """Table model for class management (ID, editable Name, instance Count)."""
+
+    HEADERS = ["ID", "Name", "Count"]
+    FETCH_BATCH = 256  # rows exposed to the view per fetchMore
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._loader = None
+        self._ids = []
+        self._names = []
+        self._counts = []
+        self._id_strs = []  # Display strings, formatted once per reset
+        self._count_strs = []
+        # (weakref to loader, annotations_version, category ids) of the
+        # cached counts; weak so the key never keeps a dataset alive
+        self._counts_key = None
+        self._loaded_rows = 0
+
+    def reset_from_loader(self, loader):
+        """Rebuild rows from the loader's categories and annotation counts."""
+        self.beginResetModel()
+        self._loader = loader
+        self._ids, self._names = [], []
+
+        if loader and loader.categories:
+            items = sorted(loader.categories.items())
+            self._ids = [cat_id for cat_id, _ in items]
+            self._names = [str(cat_name) for _, cat_name in items]
+
+            # Counts are aligned to the category ids, and merge can add
+            # categories without touching the annotations, so both are keyed
+            counts_key = (
+                weakref.ref(loader),
+                loader.annotations_version,
+                tuple(self._ids),
+            )
+            if counts_key != self._counts_key:
+                # Count instances per category in one vectorized pass
+                if not loader.annotations.empty:
+                    self._counts = (
+                        loader.annotations["category_id"]
+                        .value_counts()
+                        .reindex(self._ids, fill_value=0)
+                        .to_numpy()
+                    )
+                else:
+                    self._counts = [0] * len(self._ids)
+                self._count_strs = [str(count) for count in self._counts]
+                self._counts_key = counts_key
+        else:
+            self._counts, self._count_strs = [], []
+            self._counts_key = None
+
+        self._id_strs = [str(cat_id) for cat_id in self._ids]
+
+        self._loaded_rows = min(len(self._ids), self.FETCH_BATCH)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded_rows
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded_rows < len(self._ids)
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Expose the next batch of rows as the view scrolls near the end."""
+        if parent.isValid():
+            return
+        batch = min(self.FETCH_BATCH, len(self._ids) - self._loaded_rows)
+        if batch <= 0:
+            return
+        self.beginInsertRows(parent, self._loaded_rows, self._loaded_rows + batch - 1)
+        self._loaded_rows += batch
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+
+        row, col = index.row(), index.column()
+        if col == 0:
+            return self._id_strs[row]
+        if col == 1:
+            return self._names[row]
+        return self._count_strs[row]
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        # Only the name is editable
+        return EDITABLE_FLAGS if index.column() == 1 else READONLY_FLAGS
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """Rename a category in place."""
+        if (
+            not index.isValid()
+            or index.column() != 1
+            or role != Qt.EditRole
+            or self._loader is None
+        ):
+            return False
+
+        row = index.row()
+        new_name = str(value)
+        self._names[row] = new_name
+        self._loader.rename_category(self._ids[row], new_name)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
 
 class OverviewWidget(QWidget):
     """Widget for displaying dataset overview and managing classes."""
@@ -28,6 +154,9 @@ class OverviewWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.loader = None
+        self.export_worker = None
+        self.export_progress = None  # Created on first export, then reused
+        self._export_info = None
         self.initUI()
 
     def initUI(self):
@@ -55,11 +184,10 @@ class OverviewWidget(QWidget):
         class_group = QGroupBox("Class Management (Double-click name to rename)")
         class_layout = QVBoxLayout()
 
-        self.class_table = QTableWidget()
-        self.class_table.setColumnCount(3)
-        self.class_table.setHorizontalHeaderLabels(["ID", "Name", "Count"])
+        self.class_model = CategoryTableModel(self)
+        self.class_table = QTableView()
+        self.class_table.setModel(self.class_model)
         self.class_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        self.class_table.cellChanged.connect(self.on_class_rename)
 
         class_layout.addWidget(self.class_table)
         class_group.setLayout(class_layout)
@@ -186,51 +314,7 @@ class OverviewWidget(QWidget):
         self.lbl_excluded.setText(f"Excluded: {excluded_count} images")
 
         # Update Class Table
-        self.class_table.blockSignals(True)
-        self.class_table.setRowCount(0)
-
-        if self.loader.categories:
-            self.class_table.setRowCount(len(self.loader.categories))
-
-            # Count instances per category
-            if not self.loader.annotations.empty:
-                counts = self.loader.annotations["category_id"].value_counts()
-            else:
-                counts = {}
-
-            for row, (cat_id, cat_name) in enumerate(
-                sorted(self.loader.categories.items())
-            ):
-                # ID (Read-only)
-                id_item = QTableWidgetItem(str(cat_id))
-                id_item.setFlags(
-                    id_item.flags() & ~Qt.ItemIsEditable
-                )  # Disable editing
-                self.class_table.setItem(row, 0, id_item)
-
-                # Name (Editable)
-                name_item = QTableWidgetItem(str(cat_name))
-                self.class_table.setItem(row, 1, name_item)
-
-                # Count (Read-only)
-                count = counts.get(cat_id, 0)
-                count_item = QTableWidgetItem(str(count))
-                count_item.setFlags(count_item.flags() & ~Qt.ItemIsEditable)
-                self.class_table.setItem(row, 2, count_item)
-
-        self.class_table.blockSignals(False)
-
-    def on_class_rename(self, row, column):
-        """Handle class name change."""
-        if column != 1 or not self.loader:
-            return
-
-        new_name = self.class_table.item(row, column).text()
-        try:
-            cat_id = int(self.class_table.item(row, 0).text())
-            self.loader.rename_category(cat_id, new_name)
-        except ValueError:
-            pass
+        self.class_model.reset_from_loader(self.loader)
 
     def export_yolo(self):
         """Export dataset as YOLO with options dialog."""
@@ -245,9 +329,10 @@ class OverviewWidget(QWidget):
 
         config = dialog.get_export_config()
 
-        # Show excluded images warning if any
+        # Show excluded images warning if any (read-only use, no copy needed)
+        excluded_count = 0
         if config["exclude_marked"]:
-            excluded_ids = self.loader.get_excluded_images()
+            excluded_ids = self.loader.excluded_image_ids
             excluded_count = len(excluded_ids)
             if excluded_count > 0:
                 # Build detailed message
@@ -255,13 +340,11 @@ class OverviewWidget(QWidget):
                 msg += "These images (and their labels) will NOT be included in the export.\n\n"
 
                 # Show first few image IDs/names as examples
-                sample_ids = list(excluded_ids)[:5]
                 sample_info = []
-                for img_id in sample_ids:
-                    if img_id in self.loader.images:
-                        file_name = self.loader.images[img_id].get(
-                            "file_name", str(img_id)
-                        )
+                for img_id in islice(excluded_ids, 5):
+                    img_info = self.loader.images.get(img_id)
+                    if img_info:
+                        file_name = img_info.get("file_name", str(img_id))
                         sample_info.append(f"  • ID {img_id}: {file_name}")
 
                 if sample_info:
@@ -309,38 +392,9 @@ class OverviewWidget(QWidget):
                 )
                 return
 
-        # Export with progress
-        progress = QProgressDialog("Exporting dataset...", "Cancel", 0, 0, self)
-        progress.setWindowModality(Qt.WindowModal)
-        progress.show()
-
-        try:
-            self.loader.export_as_yolo(
-                save_dir, split_info=split_info, exclude_marked=config["exclude_marked"]
-            )
-            progress.close()
-
-            # Show success message with stats
-            msg = f"Dataset exported successfully to:\n{save_dir}\n\n"
-            if split_info:
-                msg += f"Train: {len(split_info['train'])} images\n"
-                msg += f"Val: {len(split_info['val'])} images\n"
-                msg += f"Test: {len(split_info['test'])} images\n"
-
-            # Show excluded images info
-            if config["exclude_marked"]:
-                excluded_count = len(self.loader.excluded_image_ids)
-                if excluded_count > 0:
-                    msg += f"\n⚠️ {excluded_count} image(s) were excluded from export."
-
-            QMessageBox.information(self, "Export Complete", msg)
-        except Exception as e:
-            progress.close()
-            QMessageBox.critical(
-                self,
-                "Export Error",
-                f"Failed to export: {e}\n\nCheck console for details.",
-            )
+        self._start_export(
+            "YOLO", save_dir, split_info, config["exclude_marked"], excluded_count
+        )
 
     def export_coco(self):
         """Export dataset as COCO with options dialog."""
@@ -355,9 +409,10 @@ class OverviewWidget(QWidget):
 
         config = dialog.get_export_config()
 
-        # Show excluded images warning if any
+        # Show excluded images warning if any (read-only use, no copy needed)
+        excluded_count = 0
         if config["exclude_marked"]:
-            excluded_ids = self.loader.get_excluded_images()
+            excluded_ids = self.loader.excluded_image_ids
             excluded_count = len(excluded_ids)
             if excluded_count > 0:
                 # Build detailed message
@@ -365,13 +420,11 @@ class OverviewWidget(QWidget):
                 msg += "These images will NOT be included in the export.\n\n"
 
                 # Show first few image IDs/names as examples
-                sample_ids = list(excluded_ids)[:5]
                 sample_info = []
-                for img_id in sample_ids:
-                    if img_id in self.loader.images:
-                        file_name = self.loader.images[img_id].get(
-                            "file_name", str(img_id)
-                        )
+                for img_id in islice(excluded_ids, 5):
+                    img_info = self.loader.images.get(img_id)
+                    if img_info:
+                        file_name = img_info.get("file_name", str(img_id))
                         sample_info.append(f"  • ID {img_id}: {file_name}")
 
                 if sample_info:
@@ -426,37 +479,78 @@ class OverviewWidget(QWidget):
             if not save_path:
                 return
 
-        # Export with progress
-        progress = QProgressDialog("Exporting dataset...", "Cancel", 0, 0, self)
-        progress.setWindowModality(Qt.WindowModal)
-        progress.show()
+        self._start_export(
+            "COCO", save_path, split_info, config["exclude_marked"], excluded_count
+        )
 
-        try:
-            self.loader.export_as_coco(
-                save_path,
-                split_info=split_info,
-                exclude_marked=config["exclude_marked"],
+    def _start_export(
+        self, export_format, save_path, split_info, exclude_marked, excluded_count
+    ):
+        """Run the export on a worker thread behind the shared progress dialog."""
+        if self.export_progress is None:
+            self.export_progress = QProgressDialog(
+                "Exporting dataset...", "Cancel", 0, 0, self
             )
-            progress.close()
-
-            # Show success message with stats
-            msg = f"Dataset exported successfully to:\n{save_path}\n\n"
-            if split_info:
-                msg += f"Train: {len(split_info['train'])} images\n"
-                msg += f"Val: {len(split_info['val'])} images\n"
-                msg += f"Test: {len(split_info['test'])} images\n"
-
-            # Show excluded images info
-            if config["exclude_marked"]:
-                excluded_count = len(self.loader.excluded_image_ids)
-                if excluded_count > 0:
-                    msg += f"\n⚠️ {excluded_count} image(s) were excluded from export."
-
-            QMessageBox.information(self, "Export Complete", msg)
-        except Exception as e:
-            progress.close()
-            QMessageBox.critical(
+            self.export_progress.setWindowModality(Qt.WindowModal)
+            self.export_progress.setMinimumDuration(0)
+            self.export_progress.setAutoClose(False)
+            self.export_progress.setAutoReset(False)
+            self.export_progress.canceled.connect(self._cancel_export)
+
+        self.export_progress.setLabelText("Exporting dataset...")
+        self.export_progress.setRange(0, 0)
+        self.export_progress.setValue(0)
+        self.export_progress.show()
+
+        self._export_info = (save_path, split_info, excluded_count)
+        self.export_worker = DatasetExportThread(
+            self.loader, export_format, save_path, split_info, exclude_marked
+        )
+        self.export_worker.progress.connect(self.on_export_progress)
+        self.export_worker.finished_export.connect(self.on_export_finished)
+        self.export_worker.error_occurred.connect(self.on_export_error)
+        self.export_worker.start()
+
+    def _cancel_export(self):
+        if self.export_worker is not None:
+            self.export_worker.requestInterruption()
+
+    def on_export_progress(self, current, total):
+        self.export_progress.setMaximum(total)
+        self.export_progress.setValue(current)
+        self.export_progress.setLabelText(
+            f"Exporting dataset... ({current}/{total} images)"
+        )
+
+    def on_export_finished(self, completed):
+        self.export_progress.close()
+        save_path, split_info, excluded_count = self._export_info
+
+        if not completed:
+            QMessageBox.information(
                 self,
-                "Export Error",
-                f"Failed to export: {e}\n\nCheck console for details.",
+                "Export Cancelled",
+                f"Export was cancelled. Partially exported files remain in:\n{save_path}",
             )
+            return
+
+        # Show success message with stats
+        msg = f"Dataset exported successfully to:\n{save_path}\n\n"
+        if split_info:
+            msg += f"Train: {len(split_info['train'])} images\n"
+            msg += f"Val: {len(split_info['val'])} images\n"
+            msg += f"Test: {len(split_info['test'])} images\n"
+
+        # Show excluded images info
+        if excluded_count > 0:
+            msg += f"\n⚠️ {excluded_count} image(s) were excluded from export."
+
+        QMessageBox.information(self, "Export Complete", msg)
+
+    def on_export_error(self, error_msg):
+        self.export_progress.close()
+        QMessageBox.critical(
+            self,
+            "Export Error",
+            f"Failed to export: {error_msg}\n\nCheck console for details.",
+        )
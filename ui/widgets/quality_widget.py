@@ -1,13 +1,10 @@
 import functools
 
 import numpy as np
-import seaborn as sns
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QBrush
 from PySide6.QtWidgets import (
     QApplication,
-    QCheckBox,
     QFileDialog,
     QGroupBox,
     QHBoxLayout,
@@ -24,7 +21,88 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from core.analysis.quality import QualityAnalyzerThread
+from core.analysis.quality import IMAGE_CACHE_PATH, QualityAnalyzerThread
+
+from .chart_view import ChartView
+
+KDE_GRID_POINTS = 200
+DENSITY_MIN_POINTS = 5000
+
+# Shared brushes for table rows, by excluded state
+_ROW_BRUSHES = {
+    True: (QBrush(Qt.red), QBrush(Qt.white)),
+    False: (QBrush(Qt.transparent), QBrush(Qt.black)),
+}
+
+
+def _downcast_analysis(df):
+    """Shrink analysis columns to the smallest dtypes that hold their values."""
+    if df.empty:
+        return df
+
+    sizes_max = max(df["width"].max(), df["height"].max())
+    size_dtype = np.uint16 if sizes_max <= np.iinfo(np.uint16).max else np.uint32
+    int32 = np.iinfo(np.int32)
+    ids = df["image_id"]
+    id_dtype = np.int32 if int32.min <= ids.min() and ids.max() <= int32.max else np.int64
+    area_dtype = (
+        np.uint32 if df["img_area"].max() <= np.iinfo(np.uint32).max else np.int64
+    )
+    return df.astype(
+        {
+            "image_id": id_dtype,
+            "img_area": area_dtype,
+            "brightness": np.float32,
+            "contrast": np.float32,
+            "blur_score": np.float32,
+            "width": size_dtype,
+            "height": size_dtype,
+        }
+    )
+
+
+def _plot_histogram(ax, values, bins, value_range, color):
+    """Draw a histogram with a KDE overlay scaled to the bin counts."""
+    counts, edges = np.histogram(values, bins=bins, range=value_range)
+    width = edges[1] - edges[0]
+    ax.bar(edges[:-1], counts, width=width, align="edge", color=color, alpha=0.6)
+    ax.set_ylabel("Count")
+
+    # KDE needs spread in the data; evaluate it on a coarse grid only
+    if len(values) > 1 and value_range[1] > value_range[0]:
+        from scipy.stats import gaussian_kde
+
+        grid = np.linspace(value_range[0], value_range[1], KDE_GRID_POINTS)
+        try:
+            density = gaussian_kde(values)(grid)
+        except np.linalg.LinAlgError:
+            return
+        ax.plot(grid, density * len(values) * width, color=color)
+
+
+def _scatter_or_density(ax, x, y, bins=200, log_y=False):
+    """Scatter small samples; above DENSITY_MIN_POINTS draw a 2D histogram.
+
+    With log_y the y bins are log-spaced so the density lines up with a
+    log-scaled y axis set by the caller.
+    """
+    if len(x) < DENSITY_MIN_POINTS:
+        ax.scatter(x, y, s=15, alpha=0.5, linewidths=0, rasterized=True)
+        return
+
+    if log_y:
+        # Non-positive values cannot be placed on a log axis
+        keep = y > 0
+        x, y = x[keep], y[keep]
+        if len(y) == 0:
+            return
+        y_bins = np.geomspace(y.min(), max(y.max(), y.min() * 1.01), bins + 1)
+    else:
+        y_bins = bins
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=(bins, y_bins))
+    ax.pcolormesh(
+        x_edges, y_edges, np.log1p(counts.T), cmap="viridis", rasterized=True
+    )
 
 
 class QualityWidget(QWidget):
@@ -32,6 +110,8 @@ class QualityWidget(QWidget):
         super().__init__()
         self.loader = data_loader
         self.analysis_df = None  # 분석 결과 캐싱
+        self._cache_valid_rows(None)
+        self._row_by_img_id = {}  # img_id -> row in quality_table
         self.img_root_path = ""  # 이미지가 있는 폴더 경로
         self.initUI()
 
@@ -64,9 +144,13 @@ class QualityWidget(QWidget):
         splitter = QSplitter(Qt.Vertical)
 
         # 차트 영역
-        self.figure = Figure(figsize=(10, 5))
-        self.canvas = FigureCanvas(self.figure)
-        splitter.addWidget(self.canvas)
+        self.chart_view = ChartView(figsize=(10, 5))
+        self.figure = self.chart_view.figure
+        # Axes are created once and cleared in place on every replot
+        self._axes = self.figure.subplots(2, 2)
+        self._message = self.figure.text(0.5, 0.5, "", ha="center", va="center")
+        self._reset_axes(visible=False)
+        splitter.addWidget(self.chart_view)
 
         # Low Quality Images Section
         quality_group = QGroupBox("Low Quality Images (Check to mark for deletion)")
@@ -90,6 +174,8 @@ class QualityWidget(QWidget):
             2, QHeaderView.Stretch
         )
         self.quality_table.setMinimumHeight(200)
+        self.quality_table.itemChanged.connect(self.on_item_changed)
+        self.quality_table.cellClicked.connect(self.on_cell_clicked)
 
         quality_layout.addWidget(self.quality_table)
         quality_group.setLayout(quality_layout)
@@ -116,8 +202,8 @@ class QualityWidget(QWidget):
         # Loader가 바뀌면 초기화 (단, 자동 분석은 하지 않음 - 무거우니까)
         self.loader = data_loader
         self.analysis_df = None
-        self.figure.clear()
-        self.canvas.draw()
+        self._cache_valid_rows(None)
+        self.chart_view.redraw(functools.partial(self._reset_axes, visible=False))
         self.status_label.setText("Data Loaded. Click 'Analyze' to scan images.")
         self.progress_bar.setValue(0)
         self.progress_bar.setVisible(False)
@@ -157,7 +243,11 @@ class QualityWidget(QWidget):
         self.status_label.setText("Analyzing images... This may take a while.")
 
         # 워커 스레드 시작
-        self.worker = QualityAnalyzerThread(self.loader.images, self.img_root_path)
+        self.worker = QualityAnalyzerThread(
+            self.loader.images,
+            self.img_root_path,
+            image_cache_path=IMAGE_CACHE_PATH,
+        )
         self.worker.progress.connect(self.update_progress)
         self.worker.finished_analysis.connect(self.on_analysis_finished)
         self.worker.error_occurred.connect(self.on_error)
@@ -174,11 +264,27 @@ class QualityWidget(QWidget):
         self.btn_load_path.setEnabled(True)
         self.progress_bar.setValue(100)
         self.status_label.setText("Analysis Complete.")
-        self.analysis_df = df
+        self.analysis_df = _downcast_analysis(df)
+        self._cache_valid_rows(self.analysis_df)
         self.plot_charts()
         self.populate_quality_table()
         self.update_marked_count()
 
+    def _cache_valid_rows(self, df):
+        """Cache rows whose image could be read, plus arrays derived from them."""
+        if df is None or df.empty:
+            self._df_valid = None
+            self._log_blur = None
+            self._img_area = None
+            return
+
+        mask = df["file_exists"].to_numpy(dtype=bool)
+        self._df_valid = df.loc[mask].reset_index(drop=True)
+        self._log_blur = np.log1p(
+            self._df_valid["blur_score"].to_numpy(dtype=np.float64)
+        )
+        self._img_area = self._df_valid["img_area"].to_numpy()
+
     def on_error(self, error_msg):
         if hasattr(self, 'loading_dialog'):
             self.loading_dialog.close()
@@ -192,117 +298,134 @@ class QualityWidget(QWidget):
         self.img_root_path = path
 
     def plot_charts(self):
-        if self.analysis_df is None or self.analysis_df.empty:
+        if self._df_valid is None:
             return
 
-        self.figure.clear()
-
-        # 데이터 필터링 (파일 있는 것만)
-        df = self.analysis_df[self.analysis_df["file_exists"]]
+        # 파일 있는 것만 (on_analysis_finished에서 캐싱)
+        self.chart_view.redraw(
+            functools.partial(
+                self._draw_charts, self._df_valid, self._log_blur, self._img_area
+            )
+        )
 
+    def _draw_charts(self, df, log_blur, img_area):
+        """Draw the four quality subplots; runs in the chart render thread."""
         if df.empty:
-            ax = self.figure.add_subplot(111)
-            ax.text(
-                0.5,
-                0.5,
-                "No valid images found in the selected directory.",
-                ha="center",
+            self._reset_axes(visible=False)
+            self._message.set_text(
+                "No valid images found in the selected directory."
             )
-            self.canvas.draw()
             return
 
+        self._reset_axes(visible=True)
+        ax1, ax2, ax3, ax4 = self._axes.flat
+
         # 1. Brightness Distribution
-        ax1 = self.figure.add_subplot(221)
-        sns.histplot(df["brightness"], bins=30, ax=ax1, color="orange", kde=True)
+        brightness = df["brightness"].to_numpy(dtype=np.float64)
+        _plot_histogram(ax1, brightness, 30, (0, 255), "orange")
         ax1.set_title("Brightness Distribution (Mean Pixel)")
         ax1.set_xlabel("Brightness (0=Black, 255=White)")
         # 팁: 너무 어둡거나(<50) 너무 밝은(>200) 데이터 비율 표시해주면 좋음
 
         # 2. Blur Score (Laplacian Variance) - Log Scale
-        ax2 = self.figure.add_subplot(222)
         # 0인 값이 있을 수 있으므로 log 처리를 위해 작은 값 더함
-        log_blur = np.log1p(df["blur_score"])
-        sns.histplot(log_blur, bins=30, ax=ax2, color="purple", kde=True)
+        _plot_histogram(
+            ax2, log_blur, 30, (log_blur.min(), log_blur.max()), "purple"
+        )
         ax2.set_title("Blur Score Distribution (Log Scale)")
         ax2.set_xlabel("Log(Laplacian Variance)")
         # Insight: 왼쪽 꼬리(Low value)에 있는 이미지들이 'Blurry' 후보군
 
         # 3. Brightness vs Contrast (Scatter)
-        ax3 = self.figure.add_subplot(223)
-        sns.scatterplot(data=df, x="brightness", y="contrast", ax=ax3, alpha=0.5, s=15)
+        _scatter_or_density(
+            ax3, df["brightness"].to_numpy(), df["contrast"].to_numpy()
+        )
         ax3.set_title("Brightness vs Contrast")
         ax3.set_xlabel("Brightness")
         ax3.set_ylabel("Contrast")
         # Insight: 왼쪽 아래(어둡고 대비 낮음), 오른쪽 아래(밝고 대비 낮음) = Low Quality
 
         # 4. Image Size vs Blur Score
-        ax4 = self.figure.add_subplot(224)
-        # 크기를 Area로 단순화 (Use copy to avoid SettingWithCopyWarning)
-        plot_df = df.copy()
-        plot_df["img_area"] = plot_df["width"] * plot_df["height"]
-        sns.scatterplot(data=plot_df, x="img_area", y="blur_score", ax=ax4, alpha=0.5, s=15)
+        # 크기를 Area로 단순화
+        _scatter_or_density(
+            ax4,
+            img_area,
+            df["blur_score"].to_numpy(dtype=np.float64),
+            log_y=True,
+        )
         ax4.set_title("Image Area vs Blur Score")
         ax4.set_xlabel("Image Area (px)")
         ax4.set_ylabel("Blur Score (Sharpness)")
         ax4.set_yscale("log")
         # Insight: 해상도가 높은데 Blur Score가 낮다면 -> 초점이 나간 '진짜 Blurry' 이미지
 
-        self.figure.tight_layout()
-        self.canvas.draw()
+    def _reset_axes(self, visible):
+        """Clear the chart axes in place and show or hide them."""
+        self._message.set_text("")
+        for ax in self._axes.flat:
+            ax.cla()
+            ax.set_visible(visible)
 
     def populate_quality_table(self):
         """Populate table with low quality images."""
-        if self.analysis_df is None or self.analysis_df.empty:
+        if self._df_valid is None or self._df_valid.empty:
             return
 
-        df = self.analysis_df[self.analysis_df["file_exists"]].copy()
-        if df.empty:
-            return
+        df = self._df_valid
+        brightness = df["brightness"].to_numpy()
+        blur_score = df["blur_score"].to_numpy()
+        contrast = df["contrast"].to_numpy()
 
         # Define thresholds for low quality
         # Too dark or too bright
-        brightness_issues = (df["brightness"] < 50) | (df["brightness"] > 200)
+        too_dark = brightness < 50
+        too_bright = brightness > 200
         # Low blur score (blurry)
-        blur_threshold = df["blur_score"].quantile(0.1)  # Bottom 10%
-        blur_issues = df["blur_score"] < blur_threshold
+        blur_issues = blur_score < np.quantile(blur_score, 0.1)  # Bottom 10%
         # Low contrast
-        contrast_threshold = df["contrast"].quantile(0.1)
-        contrast_issues = df["contrast"] < contrast_threshold
+        contrast_issues = contrast < np.quantile(contrast, 0.1)
 
         # Combine issues
-        df["has_issue"] = brightness_issues | blur_issues | contrast_issues
-        df["issue_type"] = ""
-        df.loc[
-            brightness_issues & (df["brightness"] < 50), "issue_type"
-        ] += "Too Dark; "
-        df.loc[
-            brightness_issues & (df["brightness"] > 200), "issue_type"
-        ] += "Too Bright; "
-        df.loc[blur_issues, "issue_type"] += "Blurry; "
-        df.loc[contrast_issues, "issue_type"] += "Low Contrast; "
+        has_issue = too_dark | too_bright | blur_issues | contrast_issues
+        issue_types = np.char.add(
+            np.char.add(
+                np.where(too_dark, "Too Dark; ", ""),
+                np.where(too_bright, "Too Bright; ", ""),
+            ),
+            np.char.add(
+                np.where(blur_issues, "Blurry; ", ""),
+                np.where(contrast_issues, "Low Contrast; ", ""),
+            ),
+        )[has_issue]
 
         # Filter problematic images
-        problem_df = df[df["has_issue"]].copy()
-
-        # Populate table
-        self.quality_table.setRowCount(len(problem_df))
+        problem_ids = df["image_id"].to_numpy()[has_issue]
+        problem_brightness = brightness[has_issue]
+        problem_contrast = contrast[has_issue]
+        problem_blur = blur_score[has_issue]
+
+        # Populate table; repaint and re-sort once at the end, not per cell
+        sorting = self.quality_table.isSortingEnabled()
+        self.quality_table.setUpdatesEnabled(False)
+        self.quality_table.setSortingEnabled(False)
+        self.quality_table.clearContents()
+        self.quality_table.setRowCount(len(problem_ids))
         self.quality_table.blockSignals(True)
+        self._row_by_img_id = {}
 
-        for row, (_, img_data) in enumerate(problem_df.iterrows()):
-            img_id = img_data["image_id"]
+        for row in range(len(problem_ids)):
+            img_id = int(problem_ids[row])
+            self._row_by_img_id[img_id] = row
             is_excluded = (
                 img_id in self.loader.excluded_image_ids if self.loader else False
             )
 
-            # Checkbox - use QProperty to store img_id
-            chk = QCheckBox()
-            chk.setProperty("img_id", img_id)  # Store img_id in widget
-            # Block signals while setting initial state to prevent unwanted triggers
-            chk.blockSignals(True)
-            chk.setChecked(is_excluded)
-            chk.blockSignals(False)
-            chk.stateChanged.connect(self.on_checkbox_state_changed)
-            self.quality_table.setCellWidget(row, 0, chk)
+            # Checkbox - item check state, img_id stored under UserRole
+            chk_item = QTableWidgetItem()
+            chk_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
+            chk_item.setData(Qt.UserRole, img_id)
+            chk_item.setCheckState(Qt.Checked if is_excluded else Qt.Unchecked)
+            self.quality_table.setItem(row, 0, chk_item)
 
             # ID
             self.quality_table.setItem(row, 1, QTableWidgetItem(str(img_id)))
@@ -317,63 +440,63 @@ class QualityWidget(QWidget):
 
             # Brightness
             self.quality_table.setItem(
-                row, 3, QTableWidgetItem(f"{img_data['brightness']:.1f}")
+                row, 3, QTableWidgetItem(f"{problem_brightness[row]:.1f}")
             )
 
             # Contrast
             self.quality_table.setItem(
-                row, 4, QTableWidgetItem(f"{img_data['contrast']:.1f}")
+                row, 4, QTableWidgetItem(f"{problem_contrast[row]:.1f}")
             )
 
             # Blur Score
             self.quality_table.setItem(
-                row, 5, QTableWidgetItem(f"{img_data['blur_score']:.2f}")
+                row, 5, QTableWidgetItem(f"{problem_blur[row]:.2f}")
             )
 
             # Issue
-            issue_item = QTableWidgetItem(img_data["issue_type"].strip("; "))
+            issue_item = QTableWidgetItem(issue_types[row].strip("; "))
             self.quality_table.setItem(row, 6, issue_item)
 
-            # View button
-            btn_view = QPushButton("👁 View")
-            btn_view.clicked.connect(functools.partial(self.view_image, img_id))
-            self.quality_table.setCellWidget(row, 7, btn_view)
+            # View - handled by on_cell_clicked
+            view_item = QTableWidgetItem("👁 View")
+            view_item.setFlags(Qt.ItemIsEnabled)
+            view_item.setData(Qt.UserRole, img_id)
+            self.quality_table.setItem(row, 7, view_item)
 
             # Highlight if excluded
             if is_excluded:
                 self.update_row_highlighting(row, True)
 
         self.quality_table.blockSignals(False)
+        self.quality_table.setSortingEnabled(sorting)
+        self.quality_table.setUpdatesEnabled(True)
 
-    def on_checkbox_state_changed(self, state):
-        """Handle any checkbox state change - simplified version."""
-        sender = self.sender()
-        if not isinstance(sender, QCheckBox):
-            return
-
-        if not self.loader:
+    def on_item_changed(self, item):
+        """Mark/unmark an image when its checkbox cell is toggled."""
+        if item.column() != 0 or not self.loader:
             return
 
-        # Safely get img_id
-        try:
-            raw_id = sender.property("img_id")
-            if raw_id is None:
-                return
-            img_id = int(raw_id)
-        except (ValueError, TypeError):
+        img_id = item.data(Qt.UserRole)
+        if img_id is None:
             return
 
-        # Mark/unmark image
-        # Qt.Checked is 2, Qt.Unchecked is 0.
-        # Using explicit integer comparison for robustness.
-        if state == 2:
+        is_excluded = item.checkState() == Qt.Checked
+        if is_excluded:
             self.loader.mark_image_for_exclusion(img_id)
         else:
             self.loader.unmark_image_for_exclusion(img_id)
 
         # Update UI
         self.update_marked_count()
-        self.update_row_highlighting_by_img_id(img_id)
+        self.update_row_highlighting(item.row(), is_excluded)
+
+    def on_cell_clicked(self, row, col):
+        """Open the viewer when a View cell is clicked."""
+        if col != 7:
+            return
+        item = self.quality_table.item(row, col)
+        if item is not None:
+            self.view_image(item.data(Qt.UserRole))
 
     def refresh_marked_status(self):
         """Refresh marked status in table."""
@@ -381,49 +504,31 @@ class QualityWidget(QWidget):
             return
 
         # Update all rows' highlighting based on current excluded status
-        for row in range(self.quality_table.rowCount()):
-            item = self.quality_table.item(row, 1)  # ID column
-            if item:
-                try:
-                    img_id = int(item.text())
-                    is_excluded = img_id in self.loader.excluded_image_ids
-                    # Update checkbox
-                    widget = self.quality_table.cellWidget(row, 0)
-                    if isinstance(widget, QCheckBox):
-                        widget.blockSignals(True)
-                        widget.setChecked(is_excluded)
-                        widget.blockSignals(False)
-                    # Update highlighting
-                    self.update_row_highlighting(row, is_excluded)
-                except ValueError:
-                    continue
+        excluded = self.loader.excluded_image_ids
+        self.quality_table.setUpdatesEnabled(False)
+        self.quality_table.blockSignals(True)
+        for img_id, row in self._row_by_img_id.items():
+            item = self.quality_table.item(row, 0)  # Checkbox column
+            if item is None:
+                continue
+            is_excluded = img_id in excluded
+            item.setCheckState(Qt.Checked if is_excluded else Qt.Unchecked)
+            self.update_row_highlighting(row, is_excluded)
+        self.quality_table.blockSignals(False)
+        self.quality_table.setUpdatesEnabled(True)
 
         self.update_marked_count()
 
-    def update_row_highlighting_by_img_id(self, img_id):
-        """Update highlighting for a specific image ID."""
-        is_excluded = img_id in self.loader.excluded_image_ids if self.loader else False
-
-        # Find row with this img_id
-        for row in range(self.quality_table.rowCount()):
-            item = self.quality_table.item(row, 1)  # ID column
-            if item and int(item.text()) == img_id:
-                self.update_row_highlighting(row, is_excluded)
-                break
-
     def update_row_highlighting(self, row, is_excluded):
         """Update highlighting for a specific row."""
+        background, foreground = _ROW_BRUSHES[is_excluded]
         for col in range(
             1, self.quality_table.columnCount() - 1
-        ):  # Exclude View column (button)
+        ):  # Exclude checkbox and View columns
             item = self.quality_table.item(row, col)
             if item:
-                if is_excluded:
-                    item.setBackground(Qt.red)
-                    item.setForeground(Qt.white)
-                else:
-                    item.setBackground(Qt.transparent)
-                    item.setForeground(Qt.black)
+                item.setBackground(background)
+                item.setForeground(foreground)
 
     def view_image(self, img_id):
         """Open image in viewer tab."""
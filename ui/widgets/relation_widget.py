@@ -1,10 +1,23 @@
 """Class relation analysis widget for co-occurrence and imbalance analysis."""
 
+import functools
+import weakref
+
+import numpy as np
 import pandas as pd
 import seaborn as sns
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-from PySide6.QtWidgets import QApplication, QHBoxLayout, QPushButton, QVBoxLayout, QWidget
+from PySide6.QtWidgets import QHBoxLayout, QPushButton, QVBoxLayout, QWidget
+from scipy.sparse import csr_matrix
+
+from .chart_view import ChartView
+
+# Above these class counts the co-occurrence heatmap drops cell numbers
+# and tick labels, which are unreadable and slow to draw at that size
+HEATMAP_ANNOT_MAX_CLASSES = 20
+HEATMAP_TICK_MAX_CLASSES = 30
+
+# Annotation columns the relation plots read
+RELATION_COLUMNS = ["image_id", "category_name", "area", "aspect_ratio"]
 
 
 class RelationWidget(QWidget):
@@ -19,16 +32,22 @@ class RelationWidget(QWidget):
         super().__init__()
         self.loader = data_loader
         self.main_layout = None
+        # ((weakref to loader, annotations_version), co_matrix); a weak
+        # reference so a replaced dataset is not kept alive by the key
+        self._co_cache = None
         self.initUI()
 
     def initUI(self):
         """Initialize the UI components."""
         self.main_layout = QVBoxLayout(self)
 
-        # Canvas
-        self.figure = Figure(figsize=(10, 8))
-        self.canvas = FigureCanvas(self.figure)
-        self.main_layout.addWidget(self.canvas)
+        # Chart (drawn off the GUI thread)
+        self.chart_view = ChartView(figsize=(10, 8))
+        self.figure = self.chart_view.figure
+        # Axes are created once and cleared in place on every replot
+        self._axes = self.figure.subplots(2, 2)
+        self._co_colorbar = None
+        self.main_layout.addWidget(self.chart_view)
 
         # Guide Button
         btn_layout = QHBoxLayout()
@@ -44,6 +63,8 @@ class RelationWidget(QWidget):
         Args:
             data_loader: CocoDataLoader instance.
         """
+        if data_loader is not self.loader:
+            self._co_cache = None
         self.loader = data_loader
         self.plot_charts()
 
@@ -52,31 +73,54 @@ class RelationWidget(QWidget):
         if not self.loader or self.loader.annotations.empty:
             return
 
-        self.figure.clear()
-        df = self.loader.annotations
+        key = (weakref.ref(self.loader), self.loader.annotations_version)
+        self.chart_view.redraw(
+            functools.partial(
+                self._draw_charts,
+                # Snapshot: the loader may edit its frame in place mid-render
+                self.loader.annotations[RELATION_COLUMNS].copy(),
+                key,
+            )
+        )
+
+    def _draw_charts(self, df, key):
+        """Draw the four relation subplots; runs in the chart render thread."""
+        # The heatmap colorbar owns its own axes; remove it to give ax2 its
+        # space back before the next heatmap adds a new one
+        if self._co_colorbar is not None:
+            self._co_colorbar.remove()
+            self._co_colorbar = None
+        for ax in self._axes.flat:
+            ax.cla()
+        ax1, ax2, ax3, ax4 = self._axes.flat
 
         # 1. Class Imbalance
-        ax1 = self.figure.add_subplot(221)
         counts = df["category_name"].value_counts()
         sns.barplot(x=counts.index, y=counts.values, ax=ax1, hue=counts.index, palette="viridis", legend=False)
         ax1.set_title("Class Distribution (Log Scale)")
         ax1.set_yscale("log")
         ax1.set_xticks(ax1.get_xticks())
         ax1.set_xticklabels(ax1.get_xticklabels(), rotation=45, ha="right")
-        QApplication.processEvents()
 
         # 2. Co-occurrence Matrix
-        ax2 = self.figure.add_subplot(222)
-        img_cat_matrix = pd.crosstab(df["image_id"], df["category_name"])
-        img_cat_matrix = (img_cat_matrix > 0).astype(int)
-        co_matrix = img_cat_matrix.T.dot(img_cat_matrix)
-
-        sns.heatmap(co_matrix, annot=True, fmt="d", cmap="Blues", ax=ax2)
+        co_matrix = self._co_occurrence_matrix(df, key)
+
+        # One text artist per cell; skip the numbers on large matrices
+        num_classes = co_matrix.shape[0]
+        annot = num_classes <= HEATMAP_ANNOT_MAX_CLASSES
+        sns.heatmap(
+            co_matrix,
+            annot=annot,
+            fmt="d" if annot else "",
+            cmap="Blues",
+            ax=ax2,
+            xticklabels=num_classes <= HEATMAP_TICK_MAX_CLASSES,
+            yticklabels=num_classes <= HEATMAP_TICK_MAX_CLASSES,
+        )
+        self._co_colorbar = ax2.collections[0].colorbar
         ax2.set_title("Class Co-occurrence Matrix")
-        QApplication.processEvents()
 
         # 3. Class-wise Average Area (New)
-        ax3 = self.figure.add_subplot(223)
         avg_areas = (
             df.groupby("category_name")["area"].mean().sort_values(ascending=False)
         )
@@ -85,22 +129,50 @@ class RelationWidget(QWidget):
         ax3.set_xticks(ax3.get_xticks())
         ax3.set_xticklabels(ax3.get_xticklabels(), rotation=45, ha="right")
         ax3.set_yscale("log")
-        QApplication.processEvents()
 
         # 4. Class-wise Aspect Ratio Boxplot (New)
-        ax4 = self.figure.add_subplot(224)
-        sns.boxplot(
-            x="category_name", y="aspect_ratio", data=df, ax=ax4, hue="category_name", palette="Set2", legend=False
+        # Boxes from precomputed quantiles (whiskers at 5%/95%, no fliers)
+        quantiles = (
+            df.groupby("category_name")["aspect_ratio"]
+            .quantile([0.05, 0.25, 0.5, 0.75, 0.95])
+            .unstack()
         )
+        stats = [
+            {"label": name, "whislo": lo, "q1": q1, "med": med, "q3": q3, "whishi": hi}
+            for name, lo, q1, med, q3, hi in quantiles.itertuples(name=None)
+        ]
+        boxes = ax4.bxp(stats, showfliers=False, patch_artist=True)["boxes"]
+        for box, color in zip(boxes, sns.color_palette("Set2", len(boxes))):
+            box.set_facecolor(color)
         ax4.set_title("Aspect Ratio Distribution per Class")
         ax4.set_xticks(ax4.get_xticks())
         ax4.set_xticklabels(ax4.get_xticklabels(), rotation=45, ha="right")
         ax4.set_ylim(0, 5)  # 극단적인 값 제외하고 보기 위해 제한
-        QApplication.processEvents()
 
-        self.figure.tight_layout()
-        self.canvas.draw()
-        QApplication.processEvents()
+    def _co_occurrence_matrix(self, df, key):
+        """Count images in which each pair of classes appears together.
+
+        Built from a sparse image x class incidence matrix and cached under
+        key, the (loader weakref, annotations_version) the annotations came
+        from.
+        """
+        if self._co_cache is not None and self._co_cache[0] == key:
+            return self._co_cache[1]
+
+        img_codes, img_index = pd.factorize(df["image_id"])
+        cat_codes, cat_index = pd.factorize(df["category_name"], sort=True)
+        incidence = csr_matrix(
+            (np.ones(len(df), dtype=np.int32), (img_codes, cat_codes)),
+            shape=(len(img_index), len(cat_index)),
+        )
+        # Several boxes of one class in an image count once
+        incidence.sum_duplicates()
+        incidence.data[:] = 1
+
+        co = (incidence.T @ incidence).toarray()
+        co_matrix = pd.DataFrame(co, index=cat_index, columns=cat_index)
+        self._co_cache = (key, co_matrix)
+        return co_matrix
 
     def _navigate_to_guide(self):
         """Navigate to the guide tab and scroll to relation section."""
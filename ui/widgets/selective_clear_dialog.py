@@ -1,5 +1,9 @@
 """Dialog for selectively clearing data from the dataset."""
 
+import fnmatch
+
+import numpy as np
+import pandas as pd
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -24,6 +28,16 @@ class SelectiveClearDialog(QDialog):
     def __init__(self, loader, parent=None):
         super().__init__(parent)
         self.loader = loader
+        # Lookup tables built on first use; the loader cannot change while
+        # this modal dialog is open, so they live as long as the dialog
+        self._file_names = None
+        self._sorted_img_ids = None
+        self._img_ids_by_category = None
+        self._ann_counts = None
+        self._img_ids_by_source = {}
+        # Last selection, reused while the criteria are unchanged
+        self._cached_key = None
+        self._cached_ids = None
         self.setWindowTitle("Selective Data Removal")
         self.resize(500, 400)
         self.initUI()
@@ -92,9 +106,13 @@ class SelectiveClearDialog(QDialog):
         # Source
         self.source_combo = QComboBox()
         if self.loader and hasattr(self.loader, 'get_sources'):
-            sources = self.loader.get_sources()
-            for source_name in sorted(sources):
-                img_count = len(self.loader.get_source_image_ids(source_name))
+            # Each call copies the source's id set; fetch once and reuse
+            self._img_ids_by_source = {
+                source_name: self.loader.get_source_image_ids(source_name)
+                for source_name in self.loader.get_sources()
+            }
+            for source_name in sorted(self._img_ids_by_source):
+                img_count = len(self._img_ids_by_source[source_name])
                 self.source_combo.addItem(f"{source_name} ({img_count} images)", source_name)
         options_layout.addRow("Source Dataset:", self.source_combo)
 
@@ -140,6 +158,7 @@ class SelectiveClearDialog(QDialog):
         self.id_to.setEnabled(id_range_enabled)
         self.category_combo.setEnabled(category_enabled)
         self.source_combo.setEnabled(source_enabled)
+        self._cached_key = None
 
     def preview_removal(self):
         """Preview how many items will be removed."""
@@ -154,20 +173,93 @@ class SelectiveClearDialog(QDialog):
             return
 
         # Count annotations
-        if not self.loader.annotations.empty:
-            ann_count = len(self.loader.annotations[self.loader.annotations["image_id"].isin(img_ids_to_remove)])
-        else:
-            ann_count = 0
+        ann_count = int(
+            self._get_ann_counts()
+            .reindex(list(img_ids_to_remove), fill_value=0)
+            .sum()
+        )
 
         self.preview_label.setText(
             f"Preview: {len(img_ids_to_remove)} image(s) and {ann_count} annotation(s) will be removed."
         )
 
+    def _get_file_names(self):
+        """File names indexed by image ID, for vectorized pattern matching."""
+        if self._file_names is None:
+            self._file_names = pd.Series(
+                {
+                    img_id: img_info.get("file_name", "")
+                    for img_id, img_info in self.loader.images.items()
+                },
+                dtype=object,
+            )
+        return self._file_names
+
+    def _get_sorted_img_ids(self):
+        """All image IDs as a sorted array, for range lookups by bisection."""
+        if self._sorted_img_ids is None:
+            self._sorted_img_ids = np.sort(
+                np.fromiter(
+                    self.loader.images.keys(),
+                    dtype=np.int64,
+                    count=len(self.loader.images),
+                )
+            )
+        return self._sorted_img_ids
+
+    def _get_img_ids_by_category(self):
+        """Map category ID to the set of images annotated with it."""
+        if self._img_ids_by_category is None:
+            annotations = self.loader.annotations
+            if annotations.empty:
+                self._img_ids_by_category = {}
+            else:
+                grouped = annotations.groupby("category_id")["image_id"].unique()
+                self._img_ids_by_category = {
+                    cat_id: set(img_ids.tolist())
+                    for cat_id, img_ids in grouped.items()
+                }
+        return self._img_ids_by_category
+
+    def _get_ann_counts(self):
+        """Annotation count per image ID (images without any are absent)."""
+        if self._ann_counts is None:
+            annotations = self.loader.annotations
+            if annotations.empty:
+                self._ann_counts = pd.Series(dtype=np.int64)
+            else:
+                self._ann_counts = annotations.groupby("image_id").size()
+        return self._ann_counts
+
+    def _selection_key(self):
+        """The selected method and its inputs, identifying a selection."""
+        if self.radio_filename.isChecked():
+            return ("filename", self.filename_pattern.text().strip())
+        if self.radio_id_range.isChecked():
+            return ("id_range", self.id_from.value(), self.id_to.value())
+        if self.radio_category.isChecked():
+            return ("category", self.category_combo.currentData())
+        if self.radio_source.isChecked():
+            return ("source", self.source_combo.currentData())
+        return None
+
     def _get_image_ids_to_remove(self):
-        """Get set of image IDs that match the removal criteria."""
+        """Get set of image IDs that match the removal criteria.
+
+        Preview and accept usually ask for the same selection back to back,
+        so the last result is reused while the criteria are unchanged.
+        """
         if not self.loader:
             return set()
 
+        key = self._selection_key()
+        if key != self._cached_key:
+            self._cached_ids = self._select_image_ids()
+            self._cached_key = key
+        return self._cached_ids
+
+    def _select_image_ids(self):
+        """Compute the image IDs matching the current criteria."""
         img_ids = set()
 
         if self.radio_filename.isChecked():
@@ -175,10 +267,13 @@ class SelectiveClearDialog(QDialog):
             if not pattern:
                 return set()
             
-            for img_id, img_info in self.loader.images.items():
-                file_name = img_info.get("file_name", "")
-                if pattern in file_name:
-                    img_ids.add(img_id)
+            file_names = self._get_file_names()
+            if any(ch in pattern for ch in "*?["):
+                # Glob patterns such as '*.jpg' match the whole file name
+                mask = file_names.str.match(fnmatch.translate(pattern), na=False)
+            else:
+                mask = file_names.str.contains(pattern, regex=False, na=False)
+            img_ids = set(file_names.index[mask].tolist())
 
         elif self.radio_id_range.isChecked():
             from_id = self.id_from.value()
@@ -187,9 +282,11 @@ class SelectiveClearDialog(QDialog):
             if from_id > to_id:
                 return set()
             
-            for img_id in self.loader.images.keys():
-                if from_id <= img_id <= to_id:
-                    img_ids.add(img_id)
+            sorted_ids = self._get_sorted_img_ids()
+            # Both ends inclusive
+            start = np.searchsorted(sorted_ids, from_id, side="left")
+            stop = np.searchsorted(sorted_ids, to_id, side="right")
+            img_ids = set(sorted_ids[start:stop].tolist())
 
         elif self.radio_category.isChecked():
             if self.category_combo.count() == 0:
@@ -200,13 +297,7 @@ class SelectiveClearDialog(QDialog):
                 return set()
             
             # Get all images that have annotations with this category
-            if not self.loader.annotations.empty:
-                matching_anns = self.loader.annotations[
-                    self.loader.annotations["category_id"] == cat_id
-                ]
-                img_ids = set(matching_anns["image_id"].unique())
-            else:
-                return set()
+            img_ids = self._get_img_ids_by_category().get(cat_id, set())
 
         elif self.radio_source.isChecked():
             if self.source_combo.count() == 0:
@@ -217,10 +308,7 @@ class SelectiveClearDialog(QDialog):
                 return set()
             
             # Get all images from this source
-            if hasattr(self.loader, 'get_source_image_ids'):
-                img_ids = self.loader.get_source_image_ids(source_name)
-            else:
-                return set()
+            img_ids = self._img_ids_by_source.get(source_name, set())
 
         return img_ids
 
@@ -1,10 +1,30 @@
 """Spatial analysis widget for object location and density analysis."""
 
+import functools
+import weakref
+
+import numpy as np
 import pandas as pd
 import seaborn as sns
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-from PySide6.QtWidgets import QApplication, QHBoxLayout, QPushButton, QVBoxLayout, QWidget
+from PySide6.QtWidgets import QHBoxLayout, QPushButton, QVBoxLayout, QWidget
+
+from .chart_view import ChartView
+
+# KDE cost grows superlinearly with the sample: larger classes are
+# subsampled, and classes too small for a density are drawn as points
+KDE_MAX_POINTS = 5000
+KDE_MIN_POINTS = 20
+
+# Annotation columns the spatial plots read
+SPATIAL_COLUMNS = [
+    "image_id",
+    "category_name",
+    "bbox_x",
+    "bbox_y",
+    "bbox_w",
+    "bbox_h",
+    "area",
+]
 
 
 class SpatialWidget(QWidget):
@@ -19,16 +39,24 @@ class SpatialWidget(QWidget):
         super().__init__()
         self.loader = data_loader
         self.main_layout = None
+        # Keys hold the loader weakly so a replaced dataset is not kept alive
+        # ((weakref to loader, annotations_version), counts)
+        self._center_hist_cache = None
+        # ((weakref to loader, images_version), sizes or None)
+        self._sizes_cache = None
         self.initUI()
 
     def initUI(self):
         """Initialize the UI components."""
         self.main_layout = QVBoxLayout(self)
 
-        # Canvas
-        self.figure = Figure(figsize=(10, 8))
-        self.canvas = FigureCanvas(self.figure)
-        self.main_layout.addWidget(self.canvas)
+        # Chart (drawn off the GUI thread)
+        self.chart_view = ChartView(figsize=(10, 8))
+        self.figure = self.chart_view.figure
+        # Axes are created once and cleared in place on every replot
+        self._axes = self.figure.subplots(2, 2)
+        self._center_colorbar = None
+        self.main_layout.addWidget(self.chart_view)
 
         # Guide Button
         btn_layout = QHBoxLayout()
@@ -45,6 +73,9 @@ class SpatialWidget(QWidget):
         Args:
             data_loader: CocoDataLoader instance.
         """
+        if data_loader is not self.loader:
+            self._center_hist_cache = None
+            self._sizes_cache = None
         self.loader = data_loader
         self.plot_charts()
 
@@ -53,106 +84,119 @@ class SpatialWidget(QWidget):
         if not self.loader or self.loader.annotations.empty:
             return
 
-        self.figure.clear()
-        df = self.loader.annotations
+        key = (weakref.ref(self.loader), self.loader.annotations_version)
+        self.chart_view.redraw(
+            functools.partial(
+                self._draw_charts,
+                # Snapshot: the loader may edit its frame in place mid-render
+                self.loader.annotations[SPATIAL_COLUMNS].copy(),
+                self.loader.image_id_set,
+                key,
+                self._image_sizes(),
+            )
+        )
+
+    def _draw_charts(self, df, image_ids, key, sizes):
+        """Draw the four spatial subplots; runs in the chart render thread."""
+        # The heatmap colorbar owns its own axes; remove it to give ax1 its
+        # space back before the next heatmap adds a new one
+        if self._center_colorbar is not None:
+            self._center_colorbar.remove()
+            self._center_colorbar = None
+        for ax in self._axes.flat:
+            ax.cla()
+        ax1, ax2, ax3, ax4 = self._axes.flat
 
         # 2x2 그리드 사용 (1: Center Heatmap, 2: Objects per Image, 3: IoU Dist, 4: Class Spatial - Placeholder)
 
+        # Join image sizes once; every subplot reads the derived columns
+        df_merged = None
+        if sizes is not None:
+            # Only the columns the plots read, as float32: the arithmetic
+            # below is bandwidth-bound and float64 doubles the traffic
+            df_merged = df.merge(
+                sizes, left_on="image_id", right_index=True, how="inner"
+            )
+            coords = df_merged[["bbox_x", "bbox_y", "bbox_w", "bbox_h", "area"]]
+            bx, by, bw, bh, area = coords.to_numpy(dtype=np.float32).T
+            width = df_merged["width"].to_numpy()
+            height = df_merged["height"].to_numpy()
+            half = np.float32(0.5)
+            df_merged["cx_norm"] = (bx + bw * half) / width
+            df_merged["cy_norm"] = (by + bh * half) / height
+            df_merged["area_ratio"] = area / (width * height)
+
         # 1. BBox Center Heatmap (Vectorized)
-        ax1 = self.figure.add_subplot(221)
-
-        # Vectorized approach: merge with image info
-        img_df = pd.DataFrame.from_dict(self.loader.images, orient="index")
-        if not img_df.empty and "width" in img_df.columns and "height" in img_df.columns:
-            df_merged = df.merge(img_df[["width", "height"]], left_on="image_id", right_index=True, how="inner")
-            if not df_merged.empty:
-                # Calculate normalized centers using vectorized operations
-                import numpy as np
-                bbox_array = np.array(df_merged["bbox"].tolist())
-                x, y, w, h = bbox_array[:, 0], bbox_array[:, 1], bbox_array[:, 2], bbox_array[:, 3]
-                cx_norm = (x + w / 2) / df_merged["width"].values
-                cy_norm = (y + h / 2) / df_merged["height"].values
-                
-                h = ax1.hist2d(
-                    cx_norm,
-                    cy_norm,
-                    bins=50,
-                    range=[[0, 1], [0, 1]],
-                    cmap="hot_r",
-                )
-                self.figure.colorbar(h[3], ax=ax1)
-                ax1.set_title("Normalized Object Center Distribution")
-                ax1.invert_yaxis()
-            else:
-                ax1.text(0.5, 0.5, "Image size info missing", ha="center")
+        if df_merged is not None and not df_merged.empty:
+            counts = self._center_histogram(df_merged, key)
+            # Row 0 (y=0, the image top) is drawn at the top, as in the image
+            im = ax1.imshow(
+                counts.T,
+                origin="upper",
+                extent=(0, 1, 1, 0),
+                cmap="hot_r",
+                aspect="auto",
+                interpolation="nearest",
+            )
+            self._center_colorbar = self.figure.colorbar(im, ax=ax1)
+            ax1.set_title("Normalized Object Center Distribution")
         else:
             ax1.text(0.5, 0.5, "Image size info missing", ha="center")
-        
-        QApplication.processEvents()
 
         # 2. Objects per Image Histogram
-        ax2 = self.figure.add_subplot(222)
         counts = df["image_id"].value_counts()
 
-        all_img_ids = set(self.loader.images.keys())
-        obj_img_ids = set(counts.index)
-        zero_count = len(all_img_ids - obj_img_ids)
-        data_counts = counts.tolist() + [0] * zero_count
+        zero_count = len(image_ids.difference(counts.index))
+        # Typed buffer; zero-object images are the zero-filled tail
+        data_counts = np.zeros(len(counts) + zero_count, dtype=np.int32)
+        data_counts[: len(counts)] = counts.to_numpy()
 
         sns.histplot(data_counts, bins=30, kde=False, ax=ax2)
         ax2.set_title("Objects per Image Distribution")
         ax2.set_yscale("log")
         ax2.set_xlabel("Objects Count")
-        
-        QApplication.processEvents()
 
         # 3. IoU Distribution (Overlap Analysis) - Simplified (Same Image Objects)
         # Warning: Calculating full IoU for all pairs is slow.
         # Here we approximate by checking overlapping areas or skip full N^2 check for performance.
         # Instead, let's show "BBox Area / Image Area Ratio" distribution which is faster and useful.
-        ax3 = self.figure.add_subplot(223)
 
         # Vectorized approach
-        if not img_df.empty and "width" in img_df.columns and "height" in img_df.columns:
-            df_merged = df.merge(img_df[["width", "height"]], left_on="image_id", right_index=True, how="inner")
-            if not df_merged.empty:
-                img_area = df_merged["width"] * df_merged["height"]
-                ratios = df_merged["area"] / img_area
-                ratios = ratios[ratios > 0]  # Filter out zero/negative ratios
-                
-                if len(ratios) > 0:
-                    sns.histplot(ratios, bins=50, ax=ax3, kde=True)
-                    ax3.set_title("BBox Area / Image Area Ratio")
-                    ax3.set_xlabel("Ratio (0~1)")
-                    ax3.set_yscale("log")
-        
-        QApplication.processEvents()
+        if df_merged is not None and not df_merged.empty:
+            ratios = df_merged["area_ratio"]
+            ratios = ratios[ratios > 0]  # Filter out zero/negative ratios
+
+            if len(ratios) > 0:
+                sns.histplot(ratios, bins=50, ax=ax3, kde=True)
+                ax3.set_title("BBox Area / Image Area Ratio")
+                ax3.set_xlabel("Ratio (0~1)")
+                ax3.set_yscale("log")
 
         # 4. Class-wise Spatial Distribution (Top 5 Classes)
-        ax4 = self.figure.add_subplot(224)
         top_classes = df["category_name"].value_counts().head(5).index
 
         plotted_labels = []
-        for cls in top_classes:
-            cls_df = df[df["category_name"] == cls]
-            if cls_df.empty:
-                continue
-                
-            # Vectorized approach
-            if not img_df.empty and "width" in img_df.columns and "height" in img_df.columns:
-                cls_merged = cls_df.merge(img_df[["width", "height"]], left_on="image_id", right_index=True, how="inner")
-                if not cls_merged.empty:
-                    import numpy as np
-                    bbox_array = np.array(cls_merged["bbox"].tolist())
-                    x, y, w, h = bbox_array[:, 0], bbox_array[:, 1], bbox_array[:, 2], bbox_array[:, 3]
-                    cls_cx = (x + w / 2) / cls_merged["width"].values
-                    cls_cy = (y + h / 2) / cls_merged["height"].values
-                    
-                    if len(cls_cx) > 0:
+        if df_merged is not None:
+            # One pass to bucket the top classes instead of a scan per class
+            top_df = df_merged[df_merged["category_name"].isin(top_classes)]
+            class_groups = top_df.groupby("category_name", sort=False)
+            for cls in top_classes:
+                if cls in class_groups.groups:
+                    cls_merged = class_groups.get_group(cls)
+                    cls_cx = cls_merged["cx_norm"].to_numpy()
+                    cls_cy = cls_merged["cy_norm"].to_numpy()
+                    if len(cls_cx) < KDE_MIN_POINTS:
+                        ax4.scatter(cls_cx, cls_cy, label=cls, alpha=0.5)
+                    else:
+                        if len(cls_cx) > KDE_MAX_POINTS:
+                            # Fixed seed keeps the contours stable across replots
+                            idx = np.random.default_rng(0).choice(
+                                len(cls_cx), KDE_MAX_POINTS, replace=False
+                            )
+                            cls_cx = cls_cx[idx]
+                            cls_cy = cls_cy[idx]
                         sns.kdeplot(x=cls_cx, y=cls_cy, ax=ax4, label=cls, alpha=0.5)
-                        plotted_labels.append(cls)
-            
-            QApplication.processEvents()
+                    plotted_labels.append(cls)
 
         ax4.set_title("Spatial Dist. of Top 5 Classes (KDE)")
         ax4.set_xlim(0, 1)
@@ -165,9 +209,50 @@ class SpatialWidget(QWidget):
             if handles and labels:
                 ax4.legend(fontsize="small")
 
-        self.figure.tight_layout()
-        self.canvas.draw()
-        QApplication.processEvents()
+    def _image_sizes(self):
+        """Float32 width/height per image ID, or None if sizes are missing.
+
+        Cached per images version, so replots reuse the frame until images
+        are added or removed.
+        """
+        key = (weakref.ref(self.loader), self.loader.images_version)
+        if self._sizes_cache is not None and self._sizes_cache[0] == key:
+            return self._sizes_cache[1]
+
+        # Only the two typed columns; the other image fields are never read
+        images = self.loader.images
+        count = len(images)
+        ids = np.fromiter(images.keys(), dtype=np.int64, count=count)
+        widths, heights = (
+            np.fromiter(
+                (info.get(field) or np.nan for info in images.values()),
+                dtype=np.float32,
+                count=count,
+            )
+            for field in ("width", "height")
+        )
+        has_size = not (np.isnan(widths).all() or np.isnan(heights).all())
+        sizes = (
+            pd.DataFrame({"width": widths, "height": heights}, index=ids)
+            if has_size
+            else None
+        )
+        self._sizes_cache = (key, sizes)
+        return sizes
+
+    def _center_histogram(self, df_merged, key):
+        """50x50 counts of normalized box centers, cached per annotations version."""
+        if self._center_hist_cache is not None and self._center_hist_cache[0] == key:
+            return self._center_hist_cache[1]
+
+        counts, _, _ = np.histogram2d(
+            df_merged["cx_norm"].to_numpy(),
+            df_merged["cy_norm"].to_numpy(),
+            bins=50,
+            range=[[0, 1], [0, 1]],
+        )
+        self._center_hist_cache = (key, counts)
+        return counts
 
     def _navigate_to_guide(self):
         """Navigate to the guide tab and scroll to spatial section."""
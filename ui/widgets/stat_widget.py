@@ -1,10 +1,12 @@
 """Statistics widget for displaying class distribution."""
 
-import seaborn as sns
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+import functools
+
+import numpy as np
 from PySide6.QtWidgets import QHBoxLayout, QPushButton, QVBoxLayout, QWidget
 
+from .chart_view import ChartView
+
 
 class StatWidget(QWidget):
     """Widget for displaying class distribution statistics."""
@@ -13,9 +15,13 @@ class StatWidget(QWidget):
         """Initialize the statistics widget."""
         super().__init__()
         self.layout = QVBoxLayout(self)
-        self.figure = Figure()
-        self.canvas = FigureCanvas(self.figure)
-        self.layout.addWidget(self.canvas)
+        # Chart (drawn off the GUI thread)
+        self.chart_view = ChartView(figsize=(6.4, 4.8))
+        self.figure = self.chart_view.figure
+        self._ax = self.figure.subplots()
+        self._ax.set_visible(False)
+        self._bars = None  # BarContainer reused while the class count holds
+        self.layout.addWidget(self.chart_view)
 
         # Guide button at bottom
         btn_layout = QHBoxLayout()
@@ -37,19 +43,40 @@ class StatWidget(QWidget):
         Args:
             df: DataFrame with 'category_name' column.
         """
-        self.figure.clear()
-        if df.empty:
+        # Snapshot: the loader may edit its frame in place mid-render
+        snapshot = None if df.empty else df[["category_name"]].copy()
+        self.chart_view.redraw(
+            functools.partial(self._draw_class_distribution, snapshot)
+        )
+
+    def clear_plot(self):
+        """Remove the chart, leaving an empty figure."""
+        self.chart_view.redraw(functools.partial(self._draw_class_distribution, None))
+
+    def _draw_class_distribution(self, df):
+        """Draw the class count bars; runs in the chart render thread."""
+        ax = self._ax
+        ax.set_visible(df is not None and not df.empty)
+        if not ax.get_visible():
             return
 
-        ax = self.figure.add_subplot(111)
         # 클래스별 개수 세기 및 시각화
-        sns.countplot(
-            y="category_name",
-            data=df,
-            order=df["category_name"].value_counts().index,
-            ax=ax,
-        )
-        ax.set_title("Class Distribution")
-        ax.set_xlabel("Count")
-        self.figure.tight_layout()
-        self.canvas.draw()
+        # One value_counts; bars drawn directly, most frequent class on top
+        counts = df["category_name"].value_counts()
+        values = counts.to_numpy()
+        positions = np.arange(len(counts))[::-1]
+
+        if self._bars is not None and len(self._bars) == len(counts):
+            # Same number of classes: update the existing bars in place
+            for bar, value in zip(self._bars, values):
+                bar.set_width(value)
+            ax.relim()
+            ax.autoscale_view(scalex=True, scaley=False)
+        else:
+            ax.cla()
+            self._bars = ax.barh(positions, values)
+            ax.set_ylim(-0.5, len(counts) - 0.5)
+            ax.set_title("Class Distribution")
+            ax.set_xlabel("Count")
+            ax.set_ylabel("category_name")
+        ax.set_yticks(positions, counts.index.astype(str))
@@ -1,3 +1,5 @@
+import weakref
+
 from PySide6.QtWidgets import QHBoxLayout, QPushButton, QTextEdit, QVBoxLayout, QWidget
 
 from core.analysis.statistics import StatisticsAnalyzer
@@ -7,6 +9,8 @@ class StrategyWidget(QWidget):
     def __init__(self, data_loader=None):
         super().__init__()
         self.loader = data_loader
+        # ((weakref to loader, annotations_version), stats)
+        self._stats_cache = None
         self.initUI()
 
     def initUI(self):
@@ -35,6 +39,8 @@ class StrategyWidget(QWidget):
             main_window.navigate_to_guide("strategy")
 
     def update_data(self, data_loader):
+        if data_loader is not self.loader:
+            self._stats_cache = None
         self.loader = data_loader
         self.text_report.clear()
         self.text_report.setText("Click the button to generate strategy.")
@@ -47,11 +53,13 @@ class StrategyWidget(QWidget):
         if df.empty:
             return
 
+        stats = self._get_stats(df)
+
         report = []
         report.append("# 🚀 Training Strategy Recommendation\n")
 
         # 1. Model Architecture
-        sizes = StatisticsAnalyzer.get_size_distribution(df)  # S, M, L
+        sizes = stats["sizes"]  # S, M, L
         total = sum(sizes)
         small_ratio = sizes[0] / total if total > 0 else 0
 
@@ -79,8 +87,7 @@ class StrategyWidget(QWidget):
             report.append("- **Resolution**: Consider multi-scale training.")
 
         # Density check
-        img_counts = df["image_id"].value_counts()
-        avg_obj = img_counts.mean()
+        avg_obj = stats["avg_obj"]
         if avg_obj > 20:
             report.append(
                 f"- **Density**: High density ({avg_obj:.1f} objs/img). MixUp augmentation recommended."
@@ -90,8 +97,8 @@ class StrategyWidget(QWidget):
         # 3. Hyperparameters
         report.append("## 3. Hyperparameters")
         # Anchor check (K-Means wrapper needed, but let's use aspect ratio stats)
-        ar_mean = df["aspect_ratio"].mean()
-        ar_std = df["aspect_ratio"].std()
+        ar_mean = stats["ar_mean"]
+        ar_std = stats["ar_std"]
 
         report.append(
             "- **Input Resolution**: Check the 'Geometry Analysis' tab for image sizes. Generally 640px or higher."
@@ -105,12 +112,31 @@ class StrategyWidget(QWidget):
             )
 
         # Imbalance
-        cls_counts = df["category_name"].value_counts()
-        min_cls = cls_counts.min()
-        max_cls = cls_counts.max()
+        min_cls = stats["min_cls"]
+        max_cls = stats["max_cls"]
         if max_cls / min_cls > 10:
             report.append(
                 f"- **Loss Function**: Class imbalance detected (Max/Min = {max_cls / min_cls:.1f}). Use **Focal Loss**."
             )
 
         self.text_report.setMarkdown("\n".join(report))
+
+    def _get_stats(self, df):
+        """Dataset statistics behind the report, cached per annotations version."""
+        key = (weakref.ref(self.loader), self.loader.annotations_version)
+        if self._stats_cache is not None and self._stats_cache[0] == key:
+            return self._stats_cache[1]
+
+        ar_mean, ar_std = df["aspect_ratio"].agg(["mean", "std"])
+        cls_counts = df["category_name"].value_counts()
+        stats = {
+            "sizes": StatisticsAnalyzer.get_size_distribution(df),
+            # Mean of the per-image counts, without building them
+            "avg_obj": len(df) / df["image_id"].nunique(),
+            "ar_mean": ar_mean,
+            "ar_std": ar_std,
+            "min_cls": cls_counts.min(),
+            "max_cls": cls_counts.max(),
+        }
+        self._stats_cache = (key, stats)
+        return stats
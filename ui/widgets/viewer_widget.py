@@ -1,24 +1,91 @@
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QPainter, QPen, QPixmap
+import weakref
+
+import numpy as np
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QRect, Qt, QTimer
+from PySide6.QtGui import (
+    QColor,
+    QFont,
+    QImageReader,
+    QPainter,
+    QPen,
+    QPixmap,
+    QPixmapCache,
+    QStaticText,
+)
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
+    QListView,
     QPushButton,
-    QSpinBox,
     QVBoxLayout,
     QWidget,
 )
 
+from core.data.data_loader import BBOX_COLUMNS
+
+# Decoded images kept for re-selection (QPixmapCache limit, in KB)
+PIXMAP_CACHE_KB = 256 * 1024
+
+
+class ImageListModel(QAbstractListModel):
+    """List model over image IDs; rows are rendered on demand by the view."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._img_ids = []
+
+    def set_image_ids(self, img_ids):
+        self.beginResetModel()
+        self._img_ids = img_ids
+        self.endResetModel()
+
+    def image_id(self, row):
+        return self._img_ids[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._img_ids)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return str(self._img_ids[index.row()])
+        return None
+
 
 class ViewerWidget(QWidget):
+    FILTER_DELAY_MS = 150
+
     def __init__(self, data_loader, img_root_path):
         super().__init__()
         self.loader = data_loader
         self.img_root = img_root_path
-        self.all_image_ids = list(self.loader.images.keys()) if self.loader else []
-        self.filtered_image_ids = self.all_image_ids.copy()
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_KB)
+        # Shared with the loader, which builds them once per image set
+        self.all_image_ids = self.loader.image_ids if self.loader else []
+        # Never mutated in place, only reassigned, so it can share the
+        # unfiltered list instead of copying it
+        self.filtered_image_ids = self.all_image_ids
+        # Search keys parallel to all_image_ids, lowercased once up front
+        self._search_ids = self.loader.image_id_strs if self.loader else []
+        self._search_names = (
+            [
+                self.loader.images[img_id].get("file_name", "").lower()
+                for img_id in self.all_image_ids
+            ]
+            if self.loader
+            else []
+        )
+        # ((weakref to loader, annotations_version), rows_by_img, boxes, names)
+        self._ann_index = None
+        self._static_texts = {}  # category_name -> QStaticText (layout cached)
+        # Label font, created once; keeps the default family for emoji support
+        self._label_font = QFont(self.font())
+        self._label_font.setPointSize(9)
+        # Width stays 2px whatever transform the painter uses
+        self._bbox_pen = QPen(QColor(255, 0, 0), 2)
+        self._bbox_pen.setCosmetic(True)
 
         main_layout = QVBoxLayout(self)
 
@@ -26,26 +93,31 @@ class ViewerWidget(QWidget):
         controls_layout = QHBoxLayout()
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText("Search by Image ID or filename...")
-        self.search_box.textChanged.connect(self.filter_images)
-        
-        self.page_spin = QSpinBox()
-        self.page_spin.setMinimum(1)
-        self.page_spin.setMaximum(1)
-        self.page_spin.setValue(1)
-        self.page_spin.valueChanged.connect(self.on_page_changed)
-        self.page_size = 1000  # Show 1000 items per page
+        # Filter once typing pauses rather than on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(
+            lambda: self.filter_images(self.search_box.text())
+        )
+        self.search_box.textChanged.connect(lambda text: self._filter_timer.start())
         
         controls_layout.addWidget(QLabel("Search:"))
         controls_layout.addWidget(self.search_box, 2)
-        controls_layout.addWidget(QLabel("Page:"))
-        controls_layout.addWidget(self.page_spin)
         main_layout.addLayout(controls_layout)
 
         content_layout = QHBoxLayout()
 
-        self.img_list = QListWidget()
+        # Virtualized list: only visible rows are ever rendered, so the
+        # whole (filtered) dataset is listed without pagination
+        self.list_model = ImageListModel(self)
+        self.img_list = QListView()
+        self.img_list.setUniformItemSizes(True)
+        self.img_list.setModel(self.list_model)
         self.update_image_list()
-        self.img_list.currentRowChanged.connect(self.display_image)
+        self.img_list.selectionModel().currentChanged.connect(
+            lambda current, previous: self.display_image(current.row())
+        )
 
         self.image_label = QLabel("Select an Image")
         self.image_label.setAlignment(Qt.AlignCenter)
@@ -71,7 +143,7 @@ class ViewerWidget(QWidget):
         if row_index < 0:
             return
 
-        img_id = int(self.img_list.item(row_index).text())
+        img_id = self.list_model.image_id(row_index)
         img_info = self.loader.images[img_id]
         
         # Use absolute path if available, otherwise construct from img_root
@@ -80,102 +152,136 @@ class ViewerWidget(QWidget):
         else:
             file_path = f"{self.img_root}/{img_info['file_name']}"
 
-        pixmap = QPixmap(file_path)
+        # Decode straight to the label size; the full-resolution image is
+        # never held in memory (JPEG can even downscale while decoding)
+        reader = QImageReader(file_path)
+        orig_size = reader.size()
+        target_size = self.image_label.size()
+        if orig_size.isValid() and not orig_size.isEmpty():
+            scaled_size = orig_size.scaled(target_size, Qt.KeepAspectRatio)
+            scale = scaled_size.width() / orig_size.width()
+
+            # Re-selecting an image at the same size reuses the decoded pixmap
+            cache_key = f"{file_path}@{scaled_size.width()}x{scaled_size.height()}"
+            pixmap = QPixmap()
+            if not QPixmapCache.find(cache_key, pixmap):
+                reader.setScaledSize(scaled_size)
+                pixmap = QPixmap.fromImage(reader.read())
+                if not pixmap.isNull():
+                    QPixmapCache.insert(cache_key, pixmap)
+        else:
+            # Size unknown until decoded; scale the full image afterwards
+            image = reader.read()
+            pixmap = QPixmap.fromImage(
+                image.scaled(target_size, Qt.KeepAspectRatio)
+            )
+            scale = pixmap.width() / image.width() if not image.isNull() else 1.0
+
         if pixmap.isNull():
             self.image_label.setText(f"Failed to load: {file_path}")
             return
 
-        # 원본을 유지해야 줌인/줌아웃 등에서 깨지지 않음
-        # 여기서는 단순히 복사본을 사용
-        display_pixmap = pixmap.copy()
+        rows_by_img, boxes, names = self._get_ann_index()
+        rows = rows_by_img.get(img_id)
+        if rows is None:
+            # Nothing to paint; show the (cached) pixmap as is
+            self.image_label.setPixmap(pixmap)
+            return
+
+        # Implicitly shared; painting detaches it, so the cached original
+        # stays free of annotations
+        display_pixmap = QPixmap(pixmap)
 
         painter = QPainter(display_pixmap)
-        pen = QPen(QColor(255, 0, 0), 2)
-        painter.setPen(pen)
+        painter.setPen(self._bbox_pen)
 
         # 폰트 설정 (이모지 지원을 위해 기본 폰트 사용하지만, 시스템에 따라 다를 수 있음)
-        # font = painter.font()
-        # font.setPointSize(10)
-        # painter.setFont(font)
-
-        anns = self.loader.annotations[self.loader.annotations["image_id"] == img_id]
-        for _, row in anns.iterrows():
-            x, y, w, h = row["bbox"]
-            painter.drawRect(int(x), int(y), int(w), int(h))
-
-            # 텍스트 배경 (가독성 향상)
-            text = row["category_name"]
-            # 이모지 문제: PyQt의 QPainter.drawText는 컬러 이모지를 제대로 렌더링하지 못할 수 있음.
-            # 해결책: 단순 텍스트로 표시하거나, QLabel 오버레이 사용.
-            # 여기서는 텍스트만 그림
-            painter.drawText(int(x), int(y) - 5, text)
+        painter.setFont(self._label_font)
+        # Axis-aligned 1px-grid rects and small labels gain nothing from
+        # antialiasing
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setRenderHint(QPainter.TextAntialiasing, False)
+
+        scaled_boxes = boxes[rows] * scale
+        # Boxes under a pixel after downscaling draw nothing; skip them
+        visible = (scaled_boxes[:, 2] >= 1) & (scaled_boxes[:, 3] >= 1)
+        scaled_boxes = scaled_boxes[visible].astype(int).tolist()
+        painter.drawRects([QRect(x, y, w, h) for x, y, w, h in scaled_boxes])
+
+        # 이모지 문제: PyQt의 QPainter.drawText는 컬러 이모지를 제대로 렌더링하지 못할 수 있음.
+        # 해결책: 단순 텍스트로 표시하거나, QLabel 오버레이 사용.
+        # 여기서는 텍스트만 그림
+        # Static text is placed by its top-left corner; shift by the ascent
+        # so the baseline sits 5px above the box as with drawText
+        text_offset = 5 + painter.fontMetrics().ascent()
+        for (x, y, _, _), text in zip(scaled_boxes, names[rows][visible]):
+            static_text = self._static_texts.get(text)
+            if static_text is None:
+                static_text = self._static_texts[text] = QStaticText(text)
+            painter.drawStaticText(x, y - text_offset, static_text)
 
         painter.end()
 
-        self.image_label.setPixmap(
-            display_pixmap.scaled(self.image_label.size(), Qt.KeepAspectRatio)
-        )
+        self.image_label.setPixmap(display_pixmap)
+
+    def _get_ann_index(self):
+        """Annotation rows per image with their boxes and class names.
+
+        Built with one groupby and cached per annotations version, so
+        selecting an image is a dict lookup instead of a full column scan.
+        """
+        key = (weakref.ref(self.loader), self.loader.annotations_version)
+        if self._ann_index is None or self._ann_index[0] != key:
+            annotations = self.loader.annotations
+            if annotations.empty:
+                rows_by_img = {}
+                boxes = np.empty((0, 4), dtype=np.int32)
+                names = np.empty(0, dtype=object)
+            else:
+                rows_by_img = annotations.groupby("image_id").indices
+                boxes = annotations[BBOX_COLUMNS].to_numpy().astype(np.int32)
+                names = annotations["category_name"].to_numpy(dtype=object)
+            self._ann_index = (key, rows_by_img, boxes, names)
+        return self._ann_index[1:]
 
     def filter_images(self, text):
         """Filter images based on search text."""
         if not text:
-            self.filtered_image_ids = self.all_image_ids.copy()
+            self.filtered_image_ids = self.all_image_ids
         else:
             text_lower = text.lower()
-            self.filtered_image_ids = []
-            for img_id in self.all_image_ids:
-                img_info = self.loader.images[img_id]
-                # Search by ID or filename
-                if (text_lower in str(img_id).lower() or 
-                    text_lower in img_info.get("file_name", "").lower()):
-                    self.filtered_image_ids.append(img_id)
+            # Search by ID or filename
+            self.filtered_image_ids = [
+                img_id
+                for img_id, id_str, name in zip(
+                    self.all_image_ids, self._search_ids, self._search_names
+                )
+                if text_lower in id_str or text_lower in name
+            ]
         
-        self.page_spin.setMaximum(max(1, (len(self.filtered_image_ids) + self.page_size - 1) // self.page_size))
-        self.page_spin.setValue(1)
         self.update_image_list()
 
     def update_image_list(self):
-        """Update the image list with current page."""
-        self.img_list.clear()
-        
-        if not self.filtered_image_ids:
-            return
-        
-        # Calculate page range
-        page = self.page_spin.value() - 1
-        start_idx = page * self.page_size
-        end_idx = min(start_idx + self.page_size, len(self.filtered_image_ids))
-        
-        # Add items for current page
-        page_ids = self.filtered_image_ids[start_idx:end_idx]
-        self.img_list.addItems([str(img_id) for img_id in page_ids])
-        
-        # Update page info
-        total_pages = (len(self.filtered_image_ids) + self.page_size - 1) // self.page_size
-        if total_pages > 0:
-            self.page_spin.setMaximum(total_pages)
-            self.page_spin.setSuffix(f" / {total_pages}")
-
-    def on_page_changed(self, value):
-        """Handle page change."""
-        self.update_image_list()
+        """Show the current filtered image IDs in the list."""
+        # Row of each listed ID, for O(1) selection by ID
+        self._row_by_id = {
+            img_id: row for row, img_id in enumerate(self.filtered_image_ids)
+        }
+        self.list_model.set_image_ids(self.filtered_image_ids)
 
     def select_image_by_id(self, img_id):
-        """Select image by ID, navigating to the correct page if needed."""
-        if img_id not in self.filtered_image_ids:
+        """Select image by ID, clearing the search filter if it hides it."""
+        if img_id not in self._row_by_id:
             # If not in filtered list, clear filter and add to filtered list
             self.search_box.clear()
-            self.filtered_image_ids = self.all_image_ids.copy()
+            # Filtered synchronously below; a late timer would reset the list
+            self._filter_timer.stop()
+            self.filtered_image_ids = self.all_image_ids
             self.update_image_list()
         
-        if img_id in self.filtered_image_ids:
-            # Find which page contains this image
-            idx = self.filtered_image_ids.index(img_id)
-            page = (idx // self.page_size) + 1
-            self.page_spin.setValue(page)
-            
-            # Find item in current list
-            items = self.img_list.findItems(str(img_id), Qt.MatchExactly)
-            if items:
-                row = self.img_list.row(items[0])
-                self.img_list.setCurrentRow(row)
+        row = self._row_by_id.get(img_id)
+        if row is None:
+            return
+        index = self.list_model.index(row)
+        self.img_list.setCurrentIndex(index)
+        self.img_list.scrollTo(index)